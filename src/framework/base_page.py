@@ -2,22 +2,200 @@
 Base Page Object Model class with HTML snapshot capability for Claude Code integration.
 """
 import os
+import re
+import gzip
 import time
+import queue
+import atexit
+import hashlib
 import logging
+import threading
 from pathlib import Path
-from datetime import datetime
-from typing import Tuple, List
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    ElementNotInteractableException, StaleElementReferenceException, TimeoutException,
+)
 from selenium.webdriver.common.by import By
+from framework import config_manager
 from framework.config_manager import config
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Repository root; snapshot and screenshot directories are relative to it
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Locators matching this pattern have their text masked in logs
+_SENSITIVE_RE = re.compile(r'password|token|secret', re.IGNORECASE)
+
+
+# Sets an input's value and fires the events frameworks listen for, in a single
+# WebDriver command. The prototype's value setter is used so that React-style
+# controlled inputs register the change.
+_SET_VALUE_JS = """
+var element = arguments[0];
+var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value').set;
+setter.call(element, arguments[1]);
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+
+# Locator strategies supported by find_elements_batch
+_BATCH_LOCATOR_STRATEGIES = (By.CSS_SELECTOR, By.XPATH)
+
+# Resolves a list of [strategy, value] pairs to the first matching node each
+_FIND_BATCH_JS = """
+var locators = arguments[0];
+var found = [];
+for (var i = 0; i < locators.length; i++) {
+    var by = locators[i][0], value = locators[i][1];
+    if (by === 'xpath') {
+        found.push(document.evaluate(value, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue);
+    } else {
+        found.push(document.querySelector(value));
+    }
+}
+return found;
+"""
+
+# Same lookup, but only reports whether each locator matched a node
+_PRESENT_BATCH_JS = _FIND_BATCH_JS.replace(
+    "return found;",
+    "return found.map(function (node) { return node !== null; });",
+)
+
+
+def _batch_script_args(method_name: str, locators: List[Tuple[By, str]]) -> List[List[str]]:
+    """
+    Validate locators for a batched lookup and convert them to script arguments.
+
+    Args:
+        method_name: Name of the calling method, used in the error message
+        locators: List of (By, locator_string) tuples
+
+    Returns:
+        List of [strategy, value] pairs for the batch scripts
+
+    Raises:
+        ValueError: If a locator uses a strategy other than CSS or XPath
+    """
+    for by, value in locators:
+        if by not in _BATCH_LOCATOR_STRATEGIES:
+            raise ValueError(
+                f"{method_name} only supports CSS selector and XPath locators, "
+                f"got {by}='{value}'"
+            )
+    return [list(locator) for locator in locators]
+
+
+# History snapshots are compressed with zstandard when it is installed,
+# otherwise with the standard library gzip module
+if zstandard is not None:
+    HISTORY_SUFFIX = ".html.zst"
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+
+    def _compress_history(data: bytes) -> bytes:
+        """Compress history snapshot bytes with zstandard."""
+        return _zstd_compressor.compress(data)
+else:
+    HISTORY_SUFFIX = ".html.gz"
+
+    def _compress_history(data: bytes) -> bytes:
+        """Compress history snapshot bytes with gzip."""
+        # Level 1 is several times faster than the default 9 and, on HTML,
+        # only slightly larger
+        return gzip.compress(data, compresslevel=1)
+
+
+# Directories already created during this process
+_ensured_dirs: Set[Path] = set()
+
+
+def _ensure_dir(path: Path):
+    """Create a directory (and parents) the first time it is needed."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+# Maximum number of queued snapshots written per batch by the writer thread
+SNAPSHOT_BATCH_SIZE = 32
+
+# Pending file writes: (write function, args), e.g.
+# (BasePage._write_snapshot_files, (page_name, filepath, history_filepath, html_bytes, keep_history))
+_snapshot_queue: queue.Queue = queue.Queue()
+_snapshot_worker = None
+_snapshot_worker_lock = threading.Lock()
+
+
+class _SnapshotWorker(threading.Thread):
+    """Daemon thread that drains the snapshot queue and writes files in batches."""
+
+    def __init__(self):
+        super().__init__(name="html-snapshot-writer", daemon=True)
+
+    def run(self):
+        while True:
+            batch = [_snapshot_queue.get()]
+            while len(batch) < SNAPSHOT_BATCH_SIZE:
+                try:
+                    batch.append(_snapshot_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for write, args in batch:
+                try:
+                    write(*args)
+                except Exception:
+                    # Keep the thread alive so later writes (and flush_snapshots) still complete
+                    logger.exception("Background file write %s failed", getattr(write, '__name__', write))
+                finally:
+                    _snapshot_queue.task_done()
+
+
+def _enqueue_write(write, *args):
+    """Queue a file write for the writer thread, starting it on first use."""
+    global _snapshot_worker
+    if _snapshot_worker is None:
+        with _snapshot_worker_lock:
+            if _snapshot_worker is None:
+                _snapshot_worker = _SnapshotWorker()
+                _snapshot_worker.start()
+    _snapshot_queue.put((write, args))
+
+
+def save_screenshot_file(filepath: Path, png: bytes):
+    """
+    Queue a captured screenshot to be written by the writer thread.
+
+    The call returns right away; use flush_snapshots() to wait for the write.
+
+    Args:
+        filepath: Path of the PNG file
+        png: PNG image bytes, e.g. from driver.get_screenshot_as_png()
+    """
+    _enqueue_write(BasePage._write_screenshot_file, filepath, png)
+
+
+def flush_snapshots():
+    """Block until all queued HTML snapshots and screenshots have been written to disk."""
+    _snapshot_queue.join()
+
+
+# Make sure queued snapshots reach disk before the interpreter exits
+atexit.register(flush_snapshots)
+
 
 class BasePage:
     """
@@ -29,6 +207,42 @@ class BasePage:
     (default: 2 versions) to avoid excessive storage overhead.
     """
 
+    # Page objects are created per test; slots avoid a per-instance __dict__
+    __slots__ = ('driver', '_cfg', 'wait', '_wait_cache', '_el_cache')
+
+    # Content hash of the last snapshot written per page class, used to skip
+    # rewriting identical HTML
+    _last_snapshot_hash: Dict[str, str] = {}
+
+    # Settings from config.yaml, resolved by _load_config() once per loaded
+    # config, and the config view they were resolved from
+    _shared_cfg: Optional[Dict[str, Any]] = None
+    _shared_cfg_source: Optional[Mapping] = None
+
+    @classmethod
+    def _load_config(cls) -> Dict[str, Any]:
+        """
+        Resolve the config values used by page objects and cache them.
+
+        The values are shared by all page classes and looked up again only
+        when config_manager.load_config() has loaded a new configuration.
+
+        Returns:
+            Dictionary of resolved settings
+        """
+        if BasePage._shared_cfg_source is not config_manager.config_view:
+            BasePage._shared_cfg = {
+                'page_load_timeout': config.get('selenium.page_load_timeout', 30),
+                'base_url': config.get('test_data.base_url'),
+                'poll_frequency': config.get('selenium.poll_frequency', 0.1),
+                'cache_elements': config.get('selenium.cache_elements', False),
+                'fast_text_entry': config.get('selenium.fast_text_entry', False),
+                'snapshot_dir': PROJECT_ROOT / config.get('selenium.html_snapshots_dir', 'page_snapshots'),
+                'screenshot_dir': PROJECT_ROOT / config.get('selenium.screenshots_dir', 'screenshots'),
+            }
+            BasePage._shared_cfg_source = config_manager.config_view
+        return BasePage._shared_cfg
+
     def __init__(self, driver: WebDriver):
         """
         Initialize the base page.
@@ -37,55 +251,100 @@ class BasePage:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        timeout = config.get('selenium.page_load_timeout', 30)
-        self.wait = WebDriverWait(driver, timeout)
-        logger.debug(f"Initialized {self.__class__.__name__} with timeout={timeout}s")
+        self._cfg = self._load_config()
+        timeout = self._cfg['page_load_timeout']
+        self.wait = WebDriverWait(driver, timeout, poll_frequency=self._cfg['poll_frequency'])
+        self._wait_cache: Dict[int, WebDriverWait] = {}
+        self._el_cache: Dict[Tuple[Any, Tuple[By, str]], WebElement] = {}
+        logger.debug("Initialized %s with timeout=%ss", self.__class__.__name__, timeout)
 
     def save_html_snapshot(self, keep_history: int = 2):
         """
         Manually save the current page HTML to a snapshot file.
         This allows Claude Code to read the HTML and identify accurate locators.
 
+        If the HTML is identical to the last snapshot saved for this page,
+        nothing is written. Files are written by a background thread, so the
+        call returns as soon as the page source has been captured; use
+        flush_snapshots() to wait for pending writes.
+
         Args:
             keep_history: Number of historical versions to keep (default: 2)
         """
         page_name = self.__class__.__name__
-        logger.info(f"Saving HTML snapshot for {page_name}, keeping {keep_history} historical versions")
+        logger.info("Saving HTML snapshot for %s, keeping %s historical versions", page_name, keep_history)
+
+        # Capture the page source
+        try:
+            # Encode once; the same bytes are hashed and written to both files
+            html_bytes = self.driver.page_source.encode('utf-8', errors='replace')
+
+            # Skip both writes if the page hasn't changed since the last snapshot
+            content_hash = hashlib.blake2b(html_bytes, digest_size=16).hexdigest()
+            if BasePage._last_snapshot_hash.get(page_name) == content_hash:
+                logger.debug("HTML unchanged since last snapshot for %s, skipping write", page_name)
+                return
+
+            # Create filenames based on page class name
+            snapshot_dir = self._get_snapshot_directory()
+            filepath = snapshot_dir / f"{page_name}.html"
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            history_filepath = snapshot_dir / "history" / f"{page_name}_{timestamp}{HISTORY_SUFFIX}"
+
+            BasePage._last_snapshot_hash[page_name] = content_hash
+            _enqueue_write(BasePage._write_snapshot_files,
+                           page_name, filepath, history_filepath, html_bytes, keep_history)
+
+        except Exception as e:
+            logger.error("Failed to save HTML snapshot for %s: %s", page_name, e, exc_info=True)
 
-        snapshot_dir = self._get_snapshot_directory()
-        os.makedirs(snapshot_dir, exist_ok=True)
+    @staticmethod
+    def _write_snapshot_files(page_name: str, filepath: Path, history_filepath: Path,
+                              html_bytes: bytes, keep_history: int):
+        """
+        Write a captured snapshot to disk and rotate its history.
 
-        # Create filename based on page class name
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{page_name}.html"
-        filepath = snapshot_dir / filename
+        Runs on the snapshot writer thread.
 
-        # Save the page source
+        Args:
+            page_name: Name of the page class
+            filepath: Path of the current snapshot file
+            history_filepath: Path of the timestamped history file
+            html_bytes: UTF-8 encoded page HTML to write
+            keep_history: Number of historical versions to keep
+        """
         try:
-            html_content = self.driver.page_source
-            content_size = len(html_content)
-
-            # Save current version
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            logger.debug(f"Saved current snapshot: {filepath} ({content_size} bytes)")
-
-            # Save timestamped version for history
-            history_dir = snapshot_dir / "history"
-            os.makedirs(history_dir, exist_ok=True)
-            history_filename = f"{page_name}_{timestamp}.html"
-            history_filepath = history_dir / history_filename
-            with open(history_filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            logger.debug(f"Saved historical snapshot: {history_filepath}")
+            _ensure_dir(filepath.parent)
+
+            # Save current version uncompressed so it can be read directly.
+            # Write to a temporary file and rename it into place, so readers
+            # never see a partially written snapshot. The temporary name is
+            # per process so parallel (xdist) workers never share one.
+            tmp_filepath = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+            tmp_filepath.write_bytes(html_bytes)
+            os.replace(tmp_filepath, filepath)
+            logger.debug("Saved current snapshot: %s (%s bytes)", filepath, len(html_bytes))
+
+            # Save compressed timestamped version for history
+            history_dir = history_filepath.parent
+            _ensure_dir(history_dir)
+            compressed = _compress_history(html_bytes)
+            history_filepath.write_bytes(compressed)
+            logger.debug("Saved historical snapshot: %s (%s bytes)", history_filepath, len(compressed))
 
             # Clean up old history files, keeping only the most recent ones
-            self._cleanup_history(page_name, history_dir, keep_history)
+            BasePage._cleanup_history(page_name, history_dir, keep_history)
 
         except Exception as e:
-            logger.error(f"Failed to save HTML snapshot for {page_name}: {e}", exc_info=True)
-
-    def _cleanup_history(self, page_name: str, history_dir: Path, keep_count: int):
+            # Forget the hash and directories so the next capture of this page
+            # is written again from scratch
+            BasePage._last_snapshot_hash.pop(page_name, None)
+            _ensured_dirs.discard(filepath.parent)
+            _ensured_dirs.discard(history_filepath.parent)
+            logger.error("Failed to save HTML snapshot for %s: %s", page_name, e, exc_info=True)
+
+    @staticmethod
+    def _cleanup_history(page_name: str, history_dir: Path, keep_count: int):
         """
         Remove old historical snapshots, keeping only the most recent versions.
 
@@ -95,30 +354,35 @@ class BasePage:
             keep_count: Number of recent files to keep
         """
         try:
-            # Find all history files for this page
-            history_files = sorted(
-                history_dir.glob(f"{page_name}_*.html"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )
+            # Find all history files for this page in a single directory scan
+            prefix = f"{page_name}_"
+            with os.scandir(history_dir) as it:
+                history_files = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if entry.name.startswith(prefix) and '.html' in entry.name
+                ]
+            history_files.sort(reverse=True)
 
             # Delete files beyond the keep_count
             deleted_count = 0
-            for old_file in history_files[keep_count:]:
-                old_file.unlink()
+            for _, old_file in history_files[keep_count:]:
+                try:
+                    os.unlink(old_file)
+                except FileNotFoundError:
+                    # Already removed by another (xdist) worker
+                    continue
                 deleted_count += 1
 
             if deleted_count > 0:
-                logger.debug(f"Cleaned up {deleted_count} old historical snapshots for {page_name}")
+                logger.debug("Cleaned up %s old historical snapshots for %s", deleted_count, page_name)
 
         except Exception as e:
-            logger.warning(f"Could not cleanup history files for {page_name}: {e}")
+            logger.warning("Could not cleanup history files for %s: %s", page_name, e)
 
     def _get_snapshot_directory(self) -> Path:
         """Get the directory for storing HTML snapshots."""
-        project_root = Path(__file__).parent.parent.parent
-        snapshot_dir = config.get('selenium.html_snapshots_dir', 'page_snapshots')
-        return project_root / snapshot_dir
+        return self._load_config()['snapshot_dir']
 
     def open(self, url: str = None):
         """
@@ -128,14 +392,15 @@ class BasePage:
             url: URL to open. If None, uses base_url from config
         """
         if url is None:
-            url = config.get('test_data.base_url')
+            url = self._cfg['base_url']
 
-        logger.info(f"{self.__class__.__name__}: Opening URL: {url}")
+        logger.info("%s: Opening URL: %s", self.__class__.__name__, url)
+        self._el_cache.clear()
         try:
             self.driver.get(url)
-            logger.debug(f"Successfully loaded URL: {url}")
+            logger.debug("Successfully loaded URL: %s", url)
         except Exception as e:
-            logger.error(f"Failed to open URL '{url}': {e}", exc_info=True)
+            logger.error("Failed to open URL '%s': %s", url, e, exc_info=True)
             raise
 
     def find_element(self, locator: Tuple[By, str]) -> WebElement:
@@ -165,6 +430,126 @@ class BasePage:
         """
         return self.driver.find_elements(*locator)
 
+    def find_elements_batch(self, locators: List[Tuple[By, str]]) -> List[Optional[WebElement]]:
+        """
+        Find the first element for each of several locators in one round-trip.
+
+        All lookups run in a single execute_script call instead of one
+        findElement request per locator. Only CSS selector and XPath locators
+        are supported.
+
+        Args:
+            locators: List of (By, locator_string) tuples
+
+        Returns:
+            List with the matching WebElement, or None if nothing matched, for
+            each locator in order
+
+        Raises:
+            ValueError: If a locator uses a strategy other than CSS or XPath
+
+        Example:
+            logo, title = self.find_elements_batch([self.LOGO, self.HEADER_TITLE])
+        """
+        args = _batch_script_args('find_elements_batch', locators)
+        logger.debug("Finding %d elements in one batch", len(locators))
+        return self.driver.execute_script(_FIND_BATCH_JS, args)
+
+    def are_elements_present(self, locators: List[Tuple[By, str]], timeout: int = None) -> List[bool]:
+        """
+        Check whether each of several locators matches an element.
+
+        All locators are checked in a single execute_script call. If any are
+        missing, the check is repeated until all are present or the timeout
+        expires. Only CSS selector and XPath locators are supported.
+
+        Args:
+            locators: List of (By, locator_string) tuples
+            timeout: Timeout in seconds. If None, uses default
+
+        Returns:
+            List with True or False for each locator in order
+
+        Raises:
+            ValueError: If a locator uses a strategy other than CSS or XPath
+
+        Example:
+            assert all(self.are_elements_present([self.LOGO, self.HEADER_TITLE]))
+        """
+        args = _batch_script_args('are_elements_present', locators)
+        logger.debug("Checking presence of %d elements in one batch", len(locators))
+
+        present = []
+
+        def all_present(driver):
+            present[:] = driver.execute_script(_PRESENT_BATCH_JS, args)
+            return all(present)
+
+        try:
+            self._get_wait(timeout).until(all_present)
+        except TimeoutException:
+            logger.debug("Not all elements present: %s",
+                         [locator for locator, found in zip(locators, present) if not found])
+        return present
+
+    def _resolve(self, locator: Tuple[By, str], condition) -> WebElement:
+        """
+        Get the element for a locator, waiting for the given condition.
+
+        When selenium.cache_elements is enabled, the element found for each
+        locator and condition is reused until the page is opened or refreshed
+        again, saving the findElement and condition round-trips of repeated
+        interactions. A cached element's condition is not checked again.
+        Clicks don't clear the cache: elements left behind by a navigation go
+        stale and are located again by _interact().
+
+        Args:
+            locator: Tuple of (By, locator_string)
+            condition: Expected condition factory, e.g. EC.element_to_be_clickable
+
+        Returns:
+            WebElement
+
+        Raises:
+            TimeoutException: If the condition is not met within timeout period
+        """
+        if self._cfg['cache_elements']:
+            element = self._el_cache.get((condition, locator))
+            if element is not None:
+                return element
+
+        element = self.wait.until(condition(locator))
+        if self._cfg['cache_elements']:
+            self._el_cache[(condition, locator)] = element
+        return element
+
+    def _interact(self, locator: Tuple[By, str], condition, action):
+        """
+        Resolve an element and run an action on it.
+
+        If a cached element has gone stale or can no longer be interacted
+        with, it is dropped from the cache and looked up again (waiting for
+        the condition) once before retrying the action.
+
+        Args:
+            locator: Tuple of (By, locator_string)
+            condition: Expected condition factory used to locate the element
+            action: Callable taking the WebElement
+
+        Returns:
+            Result of the action
+        """
+        key = (condition, locator)
+        cached = key in self._el_cache
+        try:
+            return action(self._resolve(locator, condition))
+        except (StaleElementReferenceException, ElementNotInteractableException):
+            if not cached:
+                raise
+            logger.debug("Cached element no longer usable, locating again: %s='%s'", locator[0], locator[1])
+            self._el_cache.pop(key, None)
+            return action(self._resolve(locator, condition))
+
     def click(self, locator: Tuple[By, str]):
         """
         Click an element after waiting for it to be clickable.
@@ -175,16 +560,15 @@ class BasePage:
         Raises:
             TimeoutException: If element is not clickable within timeout period
         """
-        locator_str = f"{locator[0]}='{locator[1]}'"
-        logger.debug(f"Attempting to click element: {locator_str}")
+        logger.debug("Attempting to click element: %s='%s'", locator[0], locator[1])
 
         try:
-            element = self.wait.until(EC.element_to_be_clickable(locator))
-            element.click()
-            logger.debug(f"Successfully clicked element: {locator_str}")
+            self._interact(locator, EC.element_to_be_clickable, lambda element: element.click())
+            logger.debug("Successfully clicked element: %s='%s'", locator[0], locator[1])
         except TimeoutException:
+            locator_str = f"{locator[0]}='{locator[1]}'"
             current_url = self.driver.current_url
-            logger.error(f"Element not clickable within timeout: {locator_str} on page {current_url}")
+            logger.error("Element not clickable within timeout: %s on page %s", locator_str, current_url)
             raise TimeoutException(
                 f"Element with locator {locator_str} was not clickable within timeout. "
                 f"Current URL: {current_url}"
@@ -194,6 +578,10 @@ class BasePage:
         """
         Enter text into an input field after waiting for it to be visible.
 
+        Existing text is replaced. With selenium.fast_text_entry enabled, the
+        value is set through JavaScript in one round-trip instead of
+        clear() + send_keys(); no key events are generated in that mode.
+
         Args:
             locator: Tuple of (By, locator_string)
             text: Text to enter
@@ -201,19 +589,25 @@ class BasePage:
         Raises:
             TimeoutException: If element is not visible within timeout period
         """
-        locator_str = f"{locator[0]}='{locator[1]}'"
-        # Mask sensitive data in logs (passwords, tokens, etc.)
-        display_text = "****" if any(word in locator[1].lower() for word in ['password', 'token', 'secret']) else text
-        logger.debug(f"Entering text '{display_text}' into element: {locator_str}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Mask sensitive data in logs (passwords, tokens, etc.)
+            display_text = "****" if _SENSITIVE_RE.search(locator[1]) else text
+            logger.debug("Entering text '%s' into element: %s='%s'", display_text, locator[0], locator[1])
+
+        def _type(element: WebElement):
+            if self._cfg['fast_text_entry']:
+                self.driver.execute_script(_SET_VALUE_JS, element, text)
+            else:
+                element.clear()
+                element.send_keys(text)
 
         try:
-            element = self.wait.until(EC.visibility_of_element_located(locator))
-            element.clear()
-            element.send_keys(text)
-            logger.debug(f"Successfully entered text into element: {locator_str}")
+            self._interact(locator, EC.visibility_of_element_located, _type)
+            logger.debug("Successfully entered text into element: %s='%s'", locator[0], locator[1])
         except TimeoutException:
+            locator_str = f"{locator[0]}='{locator[1]}'"
             current_url = self.driver.current_url
-            logger.error(f"Element not visible for text entry: {locator_str} on page {current_url}")
+            logger.error("Element not visible for text entry: %s on page %s", locator_str, current_url)
             raise TimeoutException(
                 f"Element with locator {locator_str} was not visible for text entry within timeout. "
                 f"Current URL: {current_url}"
@@ -232,17 +626,16 @@ class BasePage:
         Raises:
             TimeoutException: If element is not visible within timeout period
         """
-        locator_str = f"{locator[0]}='{locator[1]}'"
-        logger.debug(f"Getting text from element: {locator_str}")
+        logger.debug("Getting text from element: %s='%s'", locator[0], locator[1])
 
         try:
-            element = self.wait.until(EC.visibility_of_element_located(locator))
-            text = element.text
-            logger.debug(f"Retrieved text '{text}' from element: {locator_str}")
+            text = self._interact(locator, EC.visibility_of_element_located, lambda element: element.text)
+            logger.debug("Retrieved text '%s' from element: %s='%s'", text, locator[0], locator[1])
             return text
         except TimeoutException:
+            locator_str = f"{locator[0]}='{locator[1]}'"
             current_url = self.driver.current_url
-            logger.error(f"Element not visible for getting text: {locator_str} on page {current_url}")
+            logger.error("Element not visible for getting text: %s on page %s", locator_str, current_url)
             raise TimeoutException(
                 f"Element with locator {locator_str} was not visible for getting text within timeout. "
                 f"Current URL: {current_url}"
@@ -259,20 +652,15 @@ class BasePage:
         Returns:
             True if element is visible, False otherwise
         """
-        locator_str = f"{locator[0]}='{locator[1]}'"
-        timeout_val = timeout or config.get('selenium.page_load_timeout', 30)
-        logger.debug(f"Checking if element is visible: {locator_str} (timeout={timeout_val}s)")
+        logger.debug("Checking if element is visible: %s='%s' (timeout=%ss)",
+                     locator[0], locator[1], timeout or self._cfg['page_load_timeout'])
 
         try:
-            if timeout:
-                wait = WebDriverWait(self.driver, timeout)
-                wait.until(EC.visibility_of_element_located(locator))
-            else:
-                self.wait.until(EC.visibility_of_element_located(locator))
-            logger.debug(f"Element is visible: {locator_str}")
+            self._get_wait(timeout).until(EC.visibility_of_element_located(locator))
+            logger.debug("Element is visible: %s='%s'", locator[0], locator[1])
             return True
         except TimeoutException:
-            logger.debug(f"Element is not visible: {locator_str}")
+            logger.debug("Element is not visible: %s='%s'", locator[0], locator[1])
             return False
 
     def wait_for_element(self, locator: Tuple[By, str], timeout: int = None) -> WebElement:
@@ -286,41 +674,76 @@ class BasePage:
         Returns:
             WebElement
         """
-        if timeout:
-            wait = WebDriverWait(self.driver, timeout)
-            return wait.until(EC.presence_of_element_located(locator))
-        return self.wait.until(EC.presence_of_element_located(locator))
+        return self._get_wait(timeout).until(EC.presence_of_element_located(locator))
+
+    def _get_wait(self, timeout: int = None) -> WebDriverWait:
+        """
+        Get a WebDriverWait for the given timeout, reusing one per timeout value.
+
+        Args:
+            timeout: Timeout in seconds. If None, uses the default page wait
+
+        Returns:
+            WebDriverWait instance
+        """
+        if not timeout:
+            return self.wait
+        wait = self._wait_cache.get(timeout)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=self._cfg['poll_frequency'])
+            self._wait_cache[timeout] = wait
+        return wait
 
     def take_screenshot(self, name: str = None):
         """
         Take a screenshot and save it.
 
+        The PNG is captured right away; the file is written by the background
+        writer thread (see flush_snapshots()).
+
         Args:
             name: Screenshot name. If None, uses timestamp and page name
         """
-        screenshot_dir = self._get_screenshot_directory()
-        os.makedirs(screenshot_dir, exist_ok=True)
-
         if name is None:
             page_name = self.__class__.__name__
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             name = f"{page_name}_{timestamp}"
 
-        filepath = screenshot_dir / f"{name}.png"
+        filepath = self._get_screenshot_directory() / f"{name}.png"
+        try:
+            png = self.driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.error("Failed to take screenshot '%s': %s", name, e, exc_info=True)
+            return
+
+        save_screenshot_file(filepath, png)
+
+    @staticmethod
+    def _write_screenshot_file(filepath: Path, png: bytes):
+        """
+        Write a captured screenshot to disk.
+
+        Runs on the snapshot writer thread.
+
+        Args:
+            filepath: Path of the PNG file
+            png: PNG image bytes
+        """
         try:
-            self.driver.save_screenshot(str(filepath))
-            logger.info(f"Screenshot saved: {filepath}")
+            _ensure_dir(filepath.parent)
+            filepath.write_bytes(png)
+            logger.info("Screenshot saved: %s", filepath)
         except Exception as e:
-            logger.error(f"Failed to save screenshot '{name}': {e}", exc_info=True)
+            _ensured_dirs.discard(filepath.parent)
+            logger.error("Failed to save screenshot '%s': %s", filepath.name, e, exc_info=True)
 
     def _get_screenshot_directory(self) -> Path:
         """Get the directory for storing screenshots."""
-        project_root = Path(__file__).parent.parent.parent
-        screenshot_dir = config.get('selenium.screenshots_dir', 'screenshots')
-        return project_root / screenshot_dir
+        return self._load_config()['screenshot_dir']
 
     def refresh_page(self):
         """Refresh the current page."""
+        self._el_cache.clear()
         self.driver.refresh()
 
     @property
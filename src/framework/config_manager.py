@@ -1,27 +1,143 @@
 """
 Configuration manager for loading and accessing test framework settings.
+
+The configuration is loaded once at import time and held at module level.
+Use the module-level get() function, or the global `config` object which
+delegates to it:
+
+    from framework.config_manager import config
+    config.get('browser.name')
 """
 import os
+import json
 import yaml
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, Tuple
+
+# Use the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# config.yaml at the project root
+_DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent.parent / "config.yaml"
+
+# Loaded configuration and a read-only view of it (rebound by load_config)
+_config: dict = {}
+config_view: Mapping = MappingProxyType(_config)
+
+# Every key path of the loaded config mapped to its value, e.g.
+# {'browser': {...}, 'browser.headless': False, ...}
+_flat: dict = {}
 
 
-class ConfigManager:
-    """Manages configuration settings for the test framework."""
+def _flatten(d: dict, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (dotted_key, value) pairs for every node of a nested dict.
+
+    Nested dicts are yielded themselves as well as recursed into, so both
+    'browser' and 'browser.headless' can be looked up directly.
+
+    Args:
+        d: Dictionary to flatten
+        prefix: Dotted path of d within the full config
+    """
+    for key, value in d.items():
+        path = f"{prefix}{key}"
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{path}.")
+
+
+def _set_config(data: dict):
+    """Install a freshly loaded config dict and rebuild the derived lookups."""
+    global _config, config_view, _flat
+    _config = data if data is not None else {}
+    config_view = MappingProxyType(_config)
+    _flat = dict(_flatten(_config))
+
+
+def load_config(config_path: str = None) -> Mapping:
+    """
+    Load configuration from YAML file.
+
+    The parsed result is cached as JSON in a hidden sidecar file next to
+    the YAML file (e.g. .config.cache.json). The cache is reused as long as
+    it is at least as new as the YAML file.
+
+    Args:
+        config_path: Path to config file. If None, uses default config.yaml
+
+    Returns:
+        Read-only view of the loaded configuration
+    """
+    config_path = Path(config_path) if config_path is not None else _DEFAULT_CONFIG_PATH
+    cache_path = config_path.with_name(f".{config_path.stem}.cache.json")
+
+    try:
+        if os.stat(cache_path).st_mtime_ns >= os.stat(config_path).st_mtime_ns:
+            _set_config(json.loads(cache_path.read_bytes()))
+            return config_view
+    except (OSError, ValueError):
+        # Missing, unreadable or corrupt cache: fall back to the YAML file
+        pass
+
+    with open(config_path, 'rb') as file:
+        _set_config(yaml.load(file, Loader=_YamlLoader))
 
-    _instance = None
-    _config = None
+    _write_cache(cache_path)
+    return config_view
 
-    def __new__(cls):
-        """Singleton pattern to ensure only one config instance."""
-        if cls._instance is None:
-            cls._instance = super(ConfigManager, cls).__new__(cls)
-        return cls._instance
 
-    def __init__(self):
-        """Initialize the config manager and load configuration."""
-        if self._config is None:
-            self.load_config()
+def _write_cache(cache_path: Path):
+    """
+    Write the loaded configuration to the JSON sidecar cache.
+
+    The cache is skipped when the config contains values JSON cannot
+    represent exactly (e.g. dates or non-string keys), and write errors
+    are ignored so a read-only checkout still works.
+
+    Args:
+        cache_path: Path of the JSON cache file
+    """
+    try:
+        data = json.dumps(_config)
+        if json.loads(data) != _config:
+            return
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        tmp_path.write_text(data, encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def get(key_path: str, default=None):
+    """
+    Get configuration value using dot notation.
+
+    Args:
+        key_path: Configuration key in dot notation (e.g., 'browser.name')
+        default: Default value if key not found
+
+    Returns:
+        Configuration value or default
+
+    Example:
+        get('browser.name')  # Returns 'chrome'
+        get('browser.headless')  # Returns False
+    """
+    return _flat.get(key_path, default)
+
+
+class ConfigManager:
+    """
+    Backward-compatible accessor for the module-level configuration.
+
+    Holds no state of its own; every method delegates to the module functions,
+    so all instances see the same configuration.
+    """
 
     def load_config(self, config_path: str = None):
         """
@@ -30,13 +146,7 @@ class ConfigManager:
         Args:
             config_path: Path to config file. If None, uses default config.yaml
         """
-        if config_path is None:
-            # Get project root directory
-            project_root = Path(__file__).parent.parent.parent
-            config_path = project_root / "config.yaml"
-
-        with open(config_path, 'r') as file:
-            self._config = yaml.safe_load(file)
+        load_config(config_path)
 
     def get(self, key_path: str, default=None):
         """
@@ -53,33 +163,28 @@ class ConfigManager:
             config.get('browser.name')  # Returns 'chrome'
             config.get('browser.headless')  # Returns False
         """
-        keys = key_path.split('.')
-        value = self._config
-
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return get(key_path, default)
 
     def get_browser_config(self) -> dict:
         """Get all browser configuration settings."""
-        return self._config.get('browser', {})
+        return _config.get('browser', {})
 
     def get_selenium_config(self) -> dict:
         """Get all selenium configuration settings."""
-        return self._config.get('selenium', {})
+        return _config.get('selenium', {})
 
     def get_test_data_config(self) -> dict:
         """Get all test data configuration settings."""
-        return self._config.get('test_data', {})
+        return _config.get('test_data', {})
 
     @property
-    def config(self) -> dict:
-        """Get the full configuration dictionary."""
-        return self._config
+    def config(self) -> Mapping:
+        """Get a read-only view of the full configuration dictionary."""
+        return config_view
+
 
+# Load the configuration once at import time
+load_config()
 
 # Global config instance
 config = ConfigManager()
@@ -1,26 +1,105 @@
 """
 WebDriver manager for creating and configuring browser instances.
+
+Browser-specific Selenium modules and webdriver-manager are imported inside the
+factory that needs them, so importing this module stays cheap and a Chrome-only
+run never loads the Firefox stack.
 """
 import logging
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from selenium.common.exceptions import WebDriverException
 from framework.config_manager import config
 
 logger = logging.getLogger(__name__)
 
+# Chrome options applied to every driver, independent of config
+_STATIC_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-blink-features=AutomationControlled',
+)
+# Chrome content setting that stops images from loading (2 = block)
+_CHROME_BLOCK_IMAGES_PREFS = {'profile.managed_default_content_settings.images': 2}
+
+_CHROME_EXPERIMENTAL = {
+    'excludeSwitches': ('enable-logging',),
+    'useAutomationExtension': False,
+}
+
+
+@lru_cache(maxsize=2)
+def _driver_path(browser_name: str) -> str:
+    """
+    Install (if needed) and return the driver binary path for a browser.
+
+    webdriver-manager checks its cache, and possibly the network, on every
+    install() call. The binary doesn't change during a run, so the path is
+    resolved once per browser per process. Failed installs are not cached.
+
+    Setting selenium.chromedriver_version pins ChromeDriver to that version,
+    so webdriver-manager can use its cached binary without first looking up
+    the latest release.
+
+    Args:
+        browser_name: 'chrome' or 'firefox'
+
+    Returns:
+        Path to the chromedriver/geckodriver executable
+    """
+    if browser_name == 'chrome':
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager(driver_version=config.get('selenium.chromedriver_version')).install()
+
+    from webdriver_manager.firefox import GeckoDriverManager
+    return GeckoDriverManager().install()
+
+
+@lru_cache(maxsize=4)
+def _parse_window_size(window_size: str) -> Tuple[int, int]:
+    """
+    Parse a 'WIDTHxHEIGHT' window size string, memoised per distinct value.
+
+    Args:
+        window_size: Window size from config, e.g. '1920x1080'
+
+    Returns:
+        (width, height) tuple
+    """
+    width, height = window_size.split('x')
+    return int(width), int(height)
+
 
 class DriverManager:
-    """Manages WebDriver creation and configuration."""
+    """
+    Manages WebDriver creation and configuration.
+
+    Drivers handed back with release_driver() are reset and kept in a pool, so
+    the next get_driver() call for the same browser and options reuses a
+    running browser instead of starting a new one. close_pool() quits all
+    pooled drivers.
+    """
+
+    # Idle drivers ready for reuse, keyed by (browser name, headless, block_images)
+    _pool: Dict[Tuple[str, bool, bool], List] = {}
+
+    # Pool key of every driver created by get_driver(), keyed by id(driver)
+    _pool_keys: Dict[int, Tuple[str, bool, bool]] = {}
 
     @staticmethod
-    def get_driver():
+    def get_driver(headless: Optional[bool] = None, block_images: bool = False):
         """
-        Create and configure a WebDriver instance based on config settings.
+        Get a WebDriver instance configured from config settings.
+
+        Reuses an idle pooled driver for the configured browser and the same
+        options if there is one, otherwise creates a new driver. Pooled
+        drivers whose browser no longer responds are quit and skipped.
+
+        Args:
+            headless: Run without a visible window. If None, uses browser.headless
+            block_images: Don't load images (for tests that only read the DOM)
 
         Returns:
             WebDriver instance configured according to config.yaml
@@ -28,38 +107,65 @@ class DriverManager:
         Raises:
             ValueError: If browser name in config is not supported
         """
-        browser_name = config.get('browser.name', 'chrome').lower()
-        logger.info(f"Creating WebDriver for browser: {browser_name}")
+        browser_config = config.get_browser_config()
+        browser_name = browser_config.get('name', 'chrome').lower()
+        if headless is None:
+            headless = browser_config.get('headless', False)
+        pool_key = (browser_name, bool(headless), bool(block_images))
+
+        idle = DriverManager._pool.get(pool_key)
+        while idle:
+            driver = idle.pop()
+            try:
+                # Cheap round-trip that fails if the browser crashed or was closed
+                driver.title
+            except WebDriverException as e:
+                logger.warning("Discarding unresponsive pooled WebDriver: %s", e)
+                DriverManager.quit_driver(driver)
+                continue
+            logger.info("Reusing pooled WebDriver for browser: %s", browser_name)
+            return driver
+
+        logger.info("Creating WebDriver for browser: %s", browser_name)
 
         try:
             if browser_name == 'chrome':
-                driver = DriverManager._create_chrome_driver()
+                driver = DriverManager._create_chrome_driver(browser_config, headless, block_images)
             elif browser_name == 'firefox':
-                driver = DriverManager._create_firefox_driver()
+                driver = DriverManager._create_firefox_driver(browser_config, headless, block_images)
             else:
                 error_msg = f"Unsupported browser: {browser_name}. Supported browsers: chrome, firefox"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            logger.info(f"Successfully created {browser_name} WebDriver")
+            logger.info("Successfully created %s WebDriver", browser_name)
+            DriverManager._pool_keys[id(driver)] = pool_key
             return driver
 
         except Exception as e:
-            logger.error(f"Failed to create WebDriver for {browser_name}: {e}", exc_info=True)
+            logger.error("Failed to create WebDriver for %s: %s", browser_name, e, exc_info=True)
             raise
 
     @staticmethod
-    def _create_chrome_driver():
+    def _create_chrome_driver(browser_config: dict, headless: bool, block_images: bool):
         """
         Create and configure a Chrome WebDriver instance.
 
         Uses webdriver-manager to automatically download and manage ChromeDriver.
         Works cross-platform (Windows, Linux, macOS).
+
+        Args:
+            browser_config: The 'browser' section of config.yaml
+            headless: Run without a visible window
+            block_images: Don't load images
         """
-        headless = config.get('browser.headless', False)
-        window_size = config.get('browser.window_size', '1920x1080')
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
 
-        logger.debug(f"Configuring Chrome driver: headless={headless}, window_size={window_size}")
+        window_size = browser_config.get('window_size', '1920x1080')
+
+        logger.debug("Configuring Chrome driver: headless=%s, window_size=%s, block_images=%s",
+                     headless, window_size, block_images)
 
         options = ChromeOptions()
 
@@ -71,70 +177,85 @@ class DriverManager:
         options.add_argument(f'--window-size={window_size}')
 
         # Common Chrome options for stability
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        options.add_experimental_option('useAutomationExtension', False)
+        for argument in _STATIC_CHROME_ARGS:
+            options.add_argument(argument)
+        for name, value in _CHROME_EXPERIMENTAL.items():
+            options.add_experimental_option(name, value)
+
+        # Skip image downloads and decoding
+        if block_images:
+            options.add_experimental_option('prefs', _CHROME_BLOCK_IMAGES_PREFS)
+            options.add_argument('--blink-settings=imagesEnabled=false')
 
         # Use webdriver-manager to automatically handle driver download/setup
         logger.debug("Installing/updating ChromeDriver via webdriver-manager")
-        service = ChromeService(ChromeDriverManager().install())
+        service = ChromeService(_driver_path('chrome'))
         driver = webdriver.Chrome(service=service, options=options)
 
         # Set timeouts
-        DriverManager._set_timeouts(driver)
+        DriverManager._set_timeouts(driver, browser_config)
 
         logger.debug("Chrome driver created successfully")
         return driver
 
     @staticmethod
-    def _create_firefox_driver():
+    def _create_firefox_driver(browser_config: dict, headless: bool, block_images: bool):
         """
         Create and configure a Firefox WebDriver instance.
 
         Uses webdriver-manager to automatically download and manage GeckoDriver.
         Works cross-platform (Windows, Linux, macOS).
+
+        Args:
+            browser_config: The 'browser' section of config.yaml
+            headless: Run without a visible window
+            block_images: Don't load images
         """
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
         options = FirefoxOptions()
 
         # Set headless mode
-        if config.get('browser.headless', False):
+        if headless:
             options.add_argument('--headless')
 
         # Set window size
-        window_size = config.get('browser.window_size', '1920x1080')
-        width, height = window_size.split('x')
-        options.set_preference('browser.window.width', int(width))
-        options.set_preference('browser.window.height', int(height))
+        width, height = _parse_window_size(browser_config.get('window_size', '1920x1080'))
+        for name, value in (('browser.window.width', width), ('browser.window.height', height)):
+            options.set_preference(name, value)
+
+        # Skip image downloads and decoding (2 = block)
+        if block_images:
+            options.set_preference('permissions.default.image', 2)
 
         # Use webdriver-manager to automatically handle driver download/setup
         logger.debug("Installing/updating GeckoDriver via webdriver-manager")
-        service = FirefoxService(GeckoDriverManager().install())
+        service = FirefoxService(_driver_path('firefox'))
         driver = webdriver.Firefox(service=service, options=options)
 
         # Set timeouts
-        DriverManager._set_timeouts(driver)
+        DriverManager._set_timeouts(driver, browser_config)
 
         logger.debug("Firefox driver created successfully")
         return driver
 
     @staticmethod
-    def _set_timeouts(driver):
+    def _set_timeouts(driver, browser_config: dict):
         """
         Set timeouts for the WebDriver instance.
 
         Args:
             driver: WebDriver instance
+            browser_config: The 'browser' section of config.yaml
         """
-        implicit_wait = config.get('browser.implicit_wait', 10)
-        page_load_timeout = config.get('browser.page_load_timeout', 30)
+        implicit_wait = browser_config.get('implicit_wait', 10)
+        page_load_timeout = browser_config.get('page_load_timeout', 30)
 
         driver.implicitly_wait(implicit_wait)
         driver.set_page_load_timeout(page_load_timeout)
 
-        logger.debug(f"Set timeouts: implicit_wait={implicit_wait}s, page_load_timeout={page_load_timeout}s")
+        logger.debug("Set timeouts: implicit_wait=%ss, page_load_timeout=%ss", implicit_wait, page_load_timeout)
 
     @staticmethod
     def quit_driver(driver):
@@ -145,9 +266,76 @@ class DriverManager:
             driver: WebDriver instance to quit
         """
         if driver:
+            DriverManager._pool_keys.pop(id(driver), None)
             try:
                 logger.info("Quitting WebDriver")
                 driver.quit()
                 logger.debug("WebDriver quit successfully")
             except Exception as e:
-                logger.error(f"Error quitting driver: {e}", exc_info=True)
+                logger.error("Error quitting driver: %s", e, exc_info=True)
+
+    @staticmethod
+    def reset_driver(driver):
+        """
+        Clear browser state so the driver can be reused by another test.
+
+        Cookies are cleared and the browser is navigated to about:blank. On
+        Chrome the cookies of every site are cleared through the DevTools
+        protocol; other browsers can only delete the current site's cookies.
+        Web storage is cleared for the current site.
+
+        Args:
+            driver: WebDriver instance to reset
+
+        Raises:
+            WebDriverException: If the browser cannot be reset
+        """
+        execute_cdp_cmd = getattr(driver, 'execute_cdp_cmd', None)
+        if execute_cdp_cmd is not None:
+            execute_cdp_cmd('Network.clearBrowserCookies', {})
+        else:
+            # WebDriver cookie commands only reach the current site, so clear them before leaving it
+            driver.delete_all_cookies()
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            # Pages such as about:blank have no web storage
+            pass
+        driver.get('about:blank')
+
+    @staticmethod
+    def release_driver(driver):
+        """
+        Reset a driver and return it to the pool for reuse.
+
+        The driver is cleaned with reset_driver(). If the reset fails, or the
+        driver was not created by get_driver(), it is quit instead.
+
+        Args:
+            driver: WebDriver instance to release
+        """
+        if not driver:
+            return
+
+        pool_key = DriverManager._pool_keys.get(id(driver))
+        if pool_key is None:
+            DriverManager.quit_driver(driver)
+            return
+
+        try:
+            DriverManager.reset_driver(driver)
+        except Exception as e:
+            logger.warning("Could not reset WebDriver for reuse, quitting it: %s", e)
+            DriverManager.quit_driver(driver)
+            return
+
+        DriverManager._pool.setdefault(pool_key, []).append(driver)
+        logger.debug("Released %s WebDriver to pool", pool_key[0])
+
+    @staticmethod
+    def close_pool():
+        """Quit every idle driver in the pool."""
+        for drivers in DriverManager._pool.values():
+            while drivers:
+                DriverManager.quit_driver(drivers.pop())
+        DriverManager._pool.clear()
@@ -3,12 +3,136 @@ Logging configuration for the test automation framework.
 
 This module provides centralized logging configuration that can be used across
 all framework components, page objects, and tests.
+
+Loggers configured by setup_logger() hand records to a shared queue; console
+and file I/O happen on a single background QueueListener thread, so logging
+calls return without waiting on the handlers.
 """
+import atexit
 import logging
+import queue
 import sys
+import time
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+
+# Queue shared by every logger configured by setup_logger(), and the single
+# listener thread that drains it (started on first use)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+# Handlers of each configured logger, keyed by logger name
+_routes: Dict[Optional[str], List[logging.Handler]] = {}
+
+# Records buffered per log file before they are written out
+FILE_BUFFER_CAPACITY = 1024
+
+# Separator line framing each test step
+_SEP = '=' * 60
+
+
+class _RoutingQueueHandler(QueueHandler):
+    """
+    QueueHandler that tags each record with the logger it was configured for.
+
+    The standard prepare() merges the message and arguments (and formats any
+    traceback) on the calling thread, so later changes to the arguments don't
+    show up in the log. The tag tells the shared listener which handlers the
+    record belongs to.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, route: Optional[str]):
+        super().__init__(log_queue)
+        self.route = route
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.log_route = self.route
+        return record
+
+
+class _RouteHandler(logging.Handler):
+    """Pass records from the shared queue to the handlers of their logger."""
+
+    def handle(self, record: logging.LogRecord):
+        for handler in _routes.get(record.log_route, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+class _BufferedFileHandler(MemoryHandler):
+    """
+    Buffer records in memory and write them to a log file in batches.
+
+    The buffer is flushed when it holds FILE_BUFFER_CAPACITY records, when a
+    WARNING or higher record arrives, and when the handler is closed.
+    """
+
+    def __init__(self, file_handler: logging.FileHandler):
+        super().__init__(
+            FILE_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+        )
+
+    def close(self):
+        """Flush buffered records and close the underlying file."""
+        # MemoryHandler.close() flushes and then drops its target
+        file_handler = self.target
+        try:
+            super().close()
+        finally:
+            if file_handler is not None:
+                file_handler.close()
+
+
+def _start_listener():
+    """Start the shared queue listener thread if it isn't running."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = QueueListener(_log_queue, _RouteHandler())
+            _listener.start()
+
+
+def _stop_listener(name: Optional[str]):
+    """
+    Remove a logger's handlers from the shared listener, then flush and close them.
+
+    The listener is stopped first so records already queued for the logger
+    are written, and restarted if other loggers still use it.
+    """
+    global _listener
+    with _listener_lock:
+        if name not in _routes:
+            return
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        for handler in _routes.pop(name):
+            handler.close()
+    if _routes:
+        _start_listener()
+
+
+def _stop_all_listeners():
+    """Drain the shared queue listener; registered to run at interpreter exit."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        for handlers in _routes.values():
+            for handler in handlers:
+                handler.close()
+        _routes.clear()
+
+
+atexit.register(_stop_all_listeners)
 
 
 def setup_logger(
@@ -37,7 +161,9 @@ def setup_logger(
     logger.setLevel(level)
 
     # Remove existing handlers to avoid duplicates
+    _stop_listener(name)
     logger.handlers = []
+    handlers = []
 
     # Create formatter
     formatter = logging.Formatter(
@@ -50,7 +176,7 @@ def setup_logger(
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler (if log file specified)
     if log_file:
@@ -61,7 +187,19 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        buffered_handler = _BufferedFileHandler(file_handler)
+        buffered_handler.setLevel(level)
+        handlers.append(buffered_handler)
+
+    # Emit through the shared queue so handler I/O runs on the listener thread
+    if handlers:
+        _routes[name] = handlers
+        _start_listener()
+
+        queue_handler = _RoutingQueueHandler(_log_queue, name)
+        queue_handler.setLevel(level)
+        logger.addHandler(queue_handler)
 
     # Prevent propagation to avoid duplicate logs
     logger.propagate = False
@@ -84,8 +222,8 @@ def get_test_logger(test_name: str, log_dir: str = "logs") -> logging.Logger:
         >>> logger = get_test_logger(__name__)
         >>> logger.info("Test execution started")
     """
-    # Create timestamped log file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Create timestamped log file (epoch nanoseconds in hex: unique and sortable)
+    timestamp = format(time.time_ns(), 'x')
     log_file = Path(log_dir) / f"{test_name}_{timestamp}.log"
 
     return setup_logger(
@@ -100,6 +238,8 @@ def log_test_step(logger: logging.Logger, step: str):
     """
     Log a test step with visual separation for better readability.
 
+    The step and its separator lines are emitted as a single record.
+
     Args:
         logger: Logger instance
         step: Description of the test step
@@ -107,9 +247,9 @@ def log_test_step(logger: logging.Logger, step: str):
     Example:
         >>> log_test_step(logger, "Navigate to login page")
     """
-    logger.info(f"{'='*60}")
-    logger.info(f"STEP: {step}")
-    logger.info(f"{'='*60}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("%s\nSTEP: %s\n%s", _SEP, step, _SEP)
 
 
 def log_assertion(logger: logging.Logger, condition: str, actual: any, expected: any, passed: bool):
@@ -126,12 +266,14 @@ def log_assertion(logger: logging.Logger, condition: str, actual: any, expected:
     Example:
         >>> log_assertion(logger, "Page title", actual_title, "Login", actual_title == "Login")
     """
-    status = "PASS" if passed else "FAIL"
     level = logging.INFO if passed else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
+    status = "PASS" if passed else "FAIL"
 
-    logger.log(level, f"ASSERT [{status}]: {condition}")
-    logger.log(level, f"  Expected: {expected}")
-    logger.log(level, f"  Actual: {actual}")
+    logger.log(level, "ASSERT [%s]: %s", status, condition)
+    logger.log(level, "  Expected: %s", expected)
+    logger.log(level, "  Actual: %s", actual)
 
 
 # Default framework logger
@@ -2,8 +2,9 @@
 GroceryMate Home Page Object.
 
 This page object contains locators and methods for interacting with the
-GroceryMate home page. HTML snapshots are automatically saved for analysis.
+GroceryMate home page. Call save_html_snapshot() to capture the page HTML for analysis.
 """
+from typing import Final
 from selenium.webdriver.common.by import By
 from framework.base_page import BasePage
 
@@ -16,33 +17,35 @@ class GroceryMateHomePage(BasePage):
     search, user account icons, and call-to-action buttons.
     """
 
+    __slots__ = ()
+
     # Header - Search Section
-    SEARCH_INPUT = (By.CSS_SELECTOR, "input[type='text'][placeholder='Search Products']")
-    SEARCH_ICON = (By.CSS_SELECTOR, ".search-cont .icon")
+    SEARCH_INPUT: Final = (By.CSS_SELECTOR, "input[type='text'][placeholder='Search Products']")
+    SEARCH_ICON: Final = (By.CSS_SELECTOR, ".search-cont .icon")
 
     # Header - Contact Info
-    CONTACT_PHONE = (By.CSS_SELECTOR, ".contact span")
+    CONTACT_PHONE: Final = (By.CSS_SELECTOR, ".contact span")
 
     # Header - User Icons
-    USER_ACCOUNT_ICON = (By.CSS_SELECTOR, ".social-icon-cont .headerIcon:nth-child(1) svg")
-    FAVORITES_ICON = (By.CSS_SELECTOR, ".social-icon-cont .headerIcon:nth-child(2) svg")
-    SHOPPING_CART_ICON = (By.CSS_SELECTOR, ".social-icon-cont .headerIcon:nth-child(3) svg")
+    USER_ACCOUNT_ICON: Final = (By.CSS_SELECTOR, ".social-icon-cont .headerIcon:nth-child(1) svg")
+    FAVORITES_ICON: Final = (By.CSS_SELECTOR, ".social-icon-cont .headerIcon:nth-child(2) svg")
+    SHOPPING_CART_ICON: Final = (By.CSS_SELECTOR, ".social-icon-cont .headerIcon:nth-child(3) svg")
 
     # Navigation Menu
-    NAV_HOME_LINK = (By.CSS_SELECTOR, ".anim-nav a[href='/']")
-    NAV_SHOP_LINK = (By.CSS_SELECTOR, ".anim-nav a[href='/store']")
-    NAV_FAVORITES_LINK = (By.CSS_SELECTOR, ".anim-nav a[href='/store/favs']")
-    NAV_CONTACT_LINK = (By.CSS_SELECTOR, ".anim-nav a[href='#!']")
+    NAV_HOME_LINK: Final = (By.CSS_SELECTOR, ".anim-nav a[href='/']")
+    NAV_SHOP_LINK: Final = (By.CSS_SELECTOR, ".anim-nav a[href='/store']")
+    NAV_FAVORITES_LINK: Final = (By.CSS_SELECTOR, ".anim-nav a[href='/store/favs']")
+    NAV_CONTACT_LINK: Final = (By.CSS_SELECTOR, ".anim-nav a[href='#!']")
 
     # Main Banner - Delicious Salad Section
-    SALAD_SHOP_NOW_BUTTON = (By.CSS_SELECTOR, ".content-sec-one .shop-now-btn button")
+    SALAD_SHOP_NOW_BUTTON: Final = (By.CSS_SELECTOR, ".content-sec-one .shop-now-btn button")
 
     # Secondary Sections
-    VEGETABLES_SHOP_NOW_BUTTON = (By.CSS_SELECTOR, ".content-section-two .shop-now-btn button")
-    WEEK_FRENZY_SHOP_NOW_BUTTON = (By.CSS_SELECTOR, ".content-section-three .shop-now-btn button")
+    VEGETABLES_SHOP_NOW_BUTTON: Final = (By.CSS_SELECTOR, ".content-section-two .shop-now-btn button")
+    WEEK_FRENZY_SHOP_NOW_BUTTON: Final = (By.CSS_SELECTOR, ".content-section-three .shop-now-btn button")
 
     # Logo
-    LOGO_IMAGE = (By.CSS_SELECTOR, ".logo-search-cont img[alt='Logo']")
+    LOGO_IMAGE: Final = (By.CSS_SELECTOR, ".logo-search-cont img[alt='Logo']")
 
     def __init__(self, driver):
         """
@@ -57,7 +60,7 @@ class GroceryMateHomePage(BasePage):
         """
         Open the GroceryMate home page using the base_url from config.
 
-        The HTML snapshot will be automatically saved after the page loads.
+        No HTML snapshot is taken; call save_html_snapshot() if one is needed.
         """
         self.open()
 
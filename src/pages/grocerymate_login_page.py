@@ -4,6 +4,7 @@ GroceryMate Login Page Object.
 This page object handles the authentication page at /auth.
 Built from HTML snapshot analysis.
 """
+from typing import Final
 from selenium.webdriver.common.by import By
 from framework.base_page import BasePage
 from framework.config_manager import config
@@ -16,21 +17,23 @@ class GroceryMateLoginPage(BasePage):
     The login form is located at https://grocerymate.masterschool.com/auth
     """
 
+    __slots__ = ()
+
     # Form Elements
-    EMAIL_INPUT = (By.CSS_SELECTOR, "input[type='email'][placeholder='Email address']")
-    PASSWORD_INPUT = (By.CSS_SELECTOR, "input[type='password'][placeholder='Password']")
-    SIGN_IN_BUTTON = (By.CSS_SELECTOR, "button[type='submit'].submit-btn")
+    EMAIL_INPUT: Final = (By.CSS_SELECTOR, "input[type='email'][placeholder='Email address']")
+    PASSWORD_INPUT: Final = (By.CSS_SELECTOR, "input[type='password'][placeholder='Password']")
+    SIGN_IN_BUTTON: Final = (By.CSS_SELECTOR, "button[type='submit'].submit-btn")
 
     # Links
-    CREATE_ACCOUNT_LINK = (By.CSS_SELECTOR, "a.switch-link")
-    HOME_LINK = (By.CSS_SELECTOR, "a.home-link")
+    CREATE_ACCOUNT_LINK: Final = (By.CSS_SELECTOR, "a.switch-link")
+    HOME_LINK: Final = (By.CSS_SELECTOR, "a.home-link")
 
     # Header Elements
-    LOGO = (By.CSS_SELECTOR, ".auth-form-header img.logo")
-    HEADER_TITLE = (By.CSS_SELECTOR, ".header-title")
+    LOGO: Final = (By.CSS_SELECTOR, ".auth-form-header img.logo")
+    HEADER_TITLE: Final = (By.CSS_SELECTOR, ".header-title")
 
     # Info Section
-    AUTH_INFO = (By.CSS_SELECTOR, ".auth-info")
+    AUTH_INFO: Final = (By.CSS_SELECTOR, ".auth-info")
 
     def __init__(self, driver):
         """
@@ -46,7 +49,7 @@ class GroceryMateLoginPage(BasePage):
         Navigate to the authentication page.
         """
         login_url = config.get('test_data.base_url') + 'auth'
-        self.driver.get(login_url)
+        self.open(login_url)
 
     def is_on_login_page(self):
         """
@@ -1,33 +1,161 @@
 """
 Pytest configuration and fixtures for selenium tests.
 """
+import os
+import json
+import logging
+import re
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Set, Tuple
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from framework.base_page import flush_snapshots, save_screenshot_file
 from framework.driver_manager import DriverManager
 from framework.config_manager import config
 
+logger = logging.getLogger(__name__)
 
-@pytest.fixture(scope="function")
-def driver():
+# Config values read by the fixtures, looked up once at import
+CFG = SimpleNamespace(
+    screenshots_on_failure=config.get('selenium.screenshots_on_failure', True),
+    screenshots_dir=config.get('selenium.screenshots_dir', 'screenshots'),
+)
+
+DRIVER_SCOPES = ("function", "module", "session")
+
+# Fixtures that start (or check out) a browser
+DRIVER_FIXTURES = ("driver", "driver_session", "driver_with_screenshots")
+
+# Duration and outcome of every test from previous runs, used to order tests
+HISTORY_FILE = Path(__file__).parent.parent / ".pytest_history.json"
+
+# Failure screenshots directory, created in pytest_configure
+SCREENSHOT_DIR = (
+    Path(__file__).resolve().parent.parent
+    / CFG.screenshots_dir
+    / "failures"
+)
+
+# Runs of characters in a test node ID that can't go in a filename
+_UNSAFE_FILENAME_CHARS = re.compile(r'[:/\\]+')
+
+# Duration and outcome of the tests in this run, keyed by node ID
+_run_results: Dict[str, dict] = {}
+
+# Node IDs of every test collected this run, including deselected ones
+_collected_ids: Set[str] = set()
+
+
+def pytest_addoption(parser):
+    """Add command line options for the selenium fixtures."""
+    parser.addoption(
+        "--driver-scope",
+        action="store",
+        default="function",
+        choices=DRIVER_SCOPES,
+        help="Scope of the driver fixture: function (default), module or session",
+    )
+
+
+def _driver_scope(fixture_name, config):
+    """Resolve the driver fixture scope from the --driver-scope option."""
+    return config.getoption("--driver-scope")
+
+
+def _get_driver_for(request, fixture_name: str):
+    """
+    Get a driver for a fixture, lightweight if its tests are marked for it.
+
+    A lightweight driver runs headless and doesn't load images. For a shared
+    (module/session) driver, every test using the fixture within that scope
+    must carry the lightweight marker.
+
+    Args:
+        request: Pytest request of the driver fixture
+        fixture_name: Name of the driver fixture
+    """
+    if request.scope == "function":
+        lightweight = request.node.get_closest_marker("lightweight") is not None
+    else:
+        users = [
+            item for item in request.session.items
+            if fixture_name in getattr(item, "fixturenames", ()) and request.node in item.listchain()
+        ]
+        lightweight = bool(users) and all(item.get_closest_marker("lightweight") for item in users)
+
+    if lightweight:
+        return DriverManager.get_driver(headless=True, block_images=True)
+    return DriverManager.get_driver()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _webdriver_manager_env():
+    """
+    Silence webdriver-manager's per-install log output for the session.
+
+    An explicit WDM_LOG in the environment is left untouched.
+    """
+    os.environ.setdefault("WDM_LOG", "0")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _driver_pool():
+    """
+    Quit all pooled WebDrivers at the end of the test session.
+
+    Function-scoped drivers are released back to the DriverManager pool after
+    each test so the next test can reuse the running browser.
+    """
+    yield
+    DriverManager.close_pool()
+
+
+@pytest.fixture(scope=_driver_scope)
+def driver(request):
     """
     Pytest fixture that provides a WebDriver instance for each test.
 
-    Scope: function - creates a new driver for each test function.
+    Scope: set by --driver-scope (default: function). With function scope each
+    test gets a driver from the DriverManager pool; with module or session
+    scope the same driver is shared and reset by _reset_driver_state after
+    every test. Either way each test starts from a clean state (no
+    cookies/storage, about:blank). Tests marked lightweight get a headless
+    driver that doesn't load images.
 
     Yields:
         WebDriver instance
 
-    After test:
-        - Takes screenshot on failure if configured
-        - Quits the driver
+    After scope:
+        - Releases the driver back to the pool
     """
-    # Create driver
-    driver_instance = DriverManager.get_driver()
+    # Acquire driver
+    driver_instance = _get_driver_for(request, "driver")
 
     yield driver_instance
 
     # Teardown
-    DriverManager.quit_driver(driver_instance)
+    DriverManager.release_driver(driver_instance)
+
+
+@pytest.fixture(autouse=True)
+def _reset_driver_state(request):
+    """
+    Reset a shared driver after each test that uses it.
+
+    Only active when --driver-scope is module or session; a function-scoped
+    driver is reset when it is released to the pool.
+    """
+    if "driver" not in request.fixturenames or request.config.getoption("--driver-scope") == "function":
+        yield
+        return
+
+    driver_instance = request.getfixturevalue("driver")
+    yield
+    try:
+        DriverManager.reset_driver(driver_instance)
+    except Exception as e:
+        logger.warning("Could not reset shared WebDriver after %s: %s", request.node.nodeid, e)
 
 
 @pytest.fixture(scope="function")
@@ -36,41 +164,226 @@ def driver_with_screenshots(request, driver):
     Pytest fixture that provides a WebDriver instance and automatically
     takes screenshots on test failure.
 
-    Scope: function - creates a new driver for each test function.
+    Scope: function - wraps the driver fixture, whatever its --driver-scope.
 
     Yields:
         WebDriver instance
 
     After test:
         - Takes screenshot on failure
-        - Quits the driver
     """
     yield driver
 
     # Take screenshot on failure
-    if request.node.rep_call.failed and config.get('selenium.screenshots_on_failure', True):
+    if request.node.rep_call.failed and CFG.screenshots_on_failure:
         _take_failure_screenshot(driver, request.node.nodeid)
 
 
 @pytest.fixture(scope="session")
-def driver_session():
+def driver_session(request):
     """
     Pytest fixture that provides a WebDriver instance for the entire test session.
 
     Scope: session - creates one driver for all tests (faster but less isolated).
 
-    Use with caution as state may carry over between tests.
+    Use with caution as state may carry over between tests. The driver is
+    lightweight (headless, no images) if every test using it is marked
+    lightweight.
 
     Yields:
         WebDriver instance
     """
-    driver_instance = DriverManager.get_driver()
+    driver_instance = _get_driver_for(request, "driver_session")
 
     yield driver_instance
 
     DriverManager.quit_driver(driver_instance)
 
 
+def _needs_browser(item) -> bool:
+    """Whether a test is a UI test or uses one of the driver fixtures."""
+    if item.get_closest_marker("ui"):
+        return True
+    fixturenames = getattr(item, "fixturenames", ())
+    return any(name in fixturenames for name in DRIVER_FIXTURES)
+
+
+def _load_history() -> dict:
+    """Read the test history file, or return an empty history if there is none."""
+    try:
+        return json.loads(HISTORY_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _group_stats(items, history: dict, node_type) -> Dict[str, Tuple[bool, bool, float, int]]:
+    """
+    Summarise the tests in each module or class and their previous results.
+
+    Args:
+        items: Collected test items
+        history: Test history keyed by node ID
+        node_type: pytest.Module or pytest.Class
+
+    Returns:
+        (needs a browser, failed before, total duration, first position)
+        keyed by group node ID
+    """
+    stats = {}
+    for index, item in enumerate(items):
+        group = item.getparent(node_type)
+        if group is None:
+            continue
+        previous = history.get(item.nodeid, {})
+        needs_browser, failed, duration, first = stats.get(group.nodeid, (False, False, 0.0, index))
+        stats[group.nodeid] = (
+            needs_browser or _needs_browser(item),
+            failed or previous.get("failed", False),
+            duration + previous.get("duration", 0.0),
+            first,
+        )
+    return stats
+
+
+def _global_reruns_set(config) -> bool:
+    """Whether reruns are configured with --reruns or the reruns ini option."""
+    if config.getoption("reruns", None) is not None:
+        return True
+    try:
+        int(config.getini("reruns"))
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Order tests for fast feedback and opt browser tests into flaky reruns.
+
+    Modules that don't need a browser run first, and within a module, classes
+    that don't need one run before those that do. After that, modules and
+    classes (and functions outside a class) are ordered by their results in
+    .pytest_history.json: groups with a test that failed last time first,
+    then shortest groups first (new tests count as zero duration). Modules and classes are never split up, so
+    module- and class-scoped fixtures are set up once, and tests within a
+    class keep their order.
+
+    If pytest-rerunfailures is installed and reruns are not configured
+    (--reruns or the reruns ini option), browser tests are rerun once when
+    they fail with a WebDriverException other than a TimeoutException;
+    timeouts are usually real failures and would only time out again.
+    """
+    _collected_ids.update(item.nodeid for item in items)
+    history = _load_history()
+    modules = _group_stats(items, history, pytest.Module)
+    classes = _group_stats(items, history, pytest.Class)
+    no_group = (False, False, 0.0, 0)
+
+    def order(item):
+        module = item.getparent(pytest.Module)
+        cls = item.getparent(pytest.Class)
+        mod_stats = modules.get(module.nodeid, no_group) if module else no_group
+        if cls:
+            cls_stats = classes.get(cls.nodeid, no_group)
+        else:
+            # Functions outside a class are ordered one by one, by their own results
+            previous = history.get(item.nodeid, {})
+            cls_stats = (
+                _needs_browser(item),
+                previous.get("failed", False),
+                previous.get("duration", 0.0),
+                0,
+            )
+        mod_browser, mod_failed, mod_duration, mod_first = mod_stats
+        cls_browser, cls_failed, cls_duration, cls_first = cls_stats
+        return (
+            mod_browser, not mod_failed, mod_duration, mod_first,
+            cls_browser, not cls_failed, cls_duration, cls_first,
+        )
+
+    items.sort(key=order)
+
+    if config.pluginmanager.hasplugin("rerunfailures") and not _global_reruns_set(config):
+        for item in items:
+            if _needs_browser(item) and item.get_closest_marker("flaky") is None:
+                item.add_marker(pytest.mark.flaky(
+                    reruns=1,
+                    only_rerun=[WebDriverException],
+                    rerun_except=[TimeoutException],
+                ))
+
+
+def pytest_deselected(items):
+    """Remember deselected tests, so their history entries are kept."""
+    _collected_ids.update(item.nodeid for item in items)
+
+
+def pytest_runtest_logreport(report):
+    """Add up each test's setup/call/teardown durations and note failures."""
+    result = _run_results.setdefault(report.nodeid, {"duration": 0.0, "failed": False})
+    result["duration"] += report.duration
+    if report.failed:
+        result["failed"] = True
+
+
+def _prune_history(history: dict, config) -> dict:
+    """
+    Drop the history entries of tests that no longer exist.
+
+    An entry is dropped if its test file is gone, or if its module was
+    collected this run and the test wasn't among the collected tests.
+    Modules narrowed down with a node ID argument (file.py::test) keep all
+    their entries.
+
+    Args:
+        history: Test history keyed by node ID
+        config: Pytest config of the session
+
+    Returns:
+        History without the entries of removed tests
+    """
+    narrowed = {
+        (config.invocation_params.dir / arg.split("::", 1)[0]).resolve()
+        for arg in config.args if "::" in arg
+    }
+    collected_files = {nodeid.split("::", 1)[0] for nodeid in _collected_ids}
+
+    def exists(nodeid: str) -> bool:
+        file_id = nodeid.split("::", 1)[0]
+        path = config.rootpath / file_id
+        if not path.is_file():
+            return False
+        if file_id in collected_files and path.resolve() not in narrowed:
+            return nodeid in _collected_ids
+        return True
+
+    return {nodeid: result for nodeid, result in history.items() if exists(nodeid)}
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Wait for queued screenshots and HTML snapshots, then save this run's
+    results to the test history file.
+
+    Tests that didn't run this time keep their previous entries, unless the
+    test no longer exists (see _prune_history). Under pytest-xdist only the
+    controller, which receives every worker's reports, writes the file.
+    """
+    flush_snapshots()
+
+    if hasattr(session.config, "workerinput") or not _run_results:
+        return
+
+    history = _prune_history(_load_history(), session.config)
+    history.update(_run_results)
+    tmp_file = HISTORY_FILE.with_name(HISTORY_FILE.name + ".tmp")
+    try:
+        tmp_file.write_text(json.dumps(history, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_file, HISTORY_FILE)
+    except OSError as e:
+        logger.warning("Could not save test history to %s: %s", HISTORY_FILE, e)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
@@ -87,31 +400,43 @@ def _take_failure_screenshot(driver, test_name: str):
     """
     Take a screenshot when a test fails.
 
+    The PNG is captured from the driver right away and written to disk by the
+    base_page writer thread, so teardown doesn't wait for the file write.
+
     Args:
         driver: WebDriver instance
         test_name: Name/ID of the failed test
     """
     try:
-        # Create screenshots directory
-        project_root = Path(__file__).parent.parent
-        screenshot_dir = project_root / config.get('selenium.screenshots_dir', 'screenshots') / "failures"
-        screenshot_dir.mkdir(parents=True, exist_ok=True)
-
         # Clean up test name for filename
-        safe_name = test_name.replace("::", "_").replace("/", "_").replace("\\", "_")
-        screenshot_path = screenshot_dir / f"{safe_name}.png"
+        safe_name = _UNSAFE_FILENAME_CHARS.sub("_", test_name)
+        screenshot_path = SCREENSHOT_DIR / f"{safe_name}.png"
 
         # Take screenshot
-        driver.save_screenshot(str(screenshot_path))
-        print(f"\nScreenshot saved: {screenshot_path}")
+        png = driver.get_screenshot_as_png()
 
     except Exception as e:
-        print(f"\nFailed to take screenshot: {e}")
+        logger.warning("Failed to take screenshot for %s: %s", test_name, e)
+        return
+
+    save_screenshot_file(screenshot_path, png)
 
 
 # Configuration for pytest
 def pytest_configure(config):
-    """Add custom markers to pytest."""
+    """
+    Add custom markers to pytest, create the failure screenshots directory and
+    set the root log level.
+
+    Test progress is logged at INFO, which is only recorded with -v (the
+    pytest.ini default); -q drops it to WARNING. Use --log-cli-level=INFO to
+    show the records live.
+    """
+    logging.getLogger().setLevel(logging.INFO if config.getoption("verbose") > 0 else logging.WARNING)
+
+    # Under pytest-xdist every worker runs this; exist_ok makes that safe
+    SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
+
     config.addinivalue_line(
         "markers", "ui: mark test as a UI test using selenium"
     )
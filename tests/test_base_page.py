@@ -0,0 +1,234 @@
+"""
+BasePage Unit Tests.
+
+These tests exercise BasePage with a mocked driver; they don't start a browser
+or need network access.
+"""
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import ElementNotInteractableException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from framework import config_manager
+from framework.base_page import BasePage, PROJECT_ROOT
+
+
+class StubElement(WebElement):
+    """WebElement stand-in that never talks to a browser."""
+
+    def __init__(self, text: str = ""):
+        self._text = text
+        self.stale = False
+        self.visible = True
+        self.enabled = True
+        self.clicks = 0
+
+    def _check(self):
+        if self.stale:
+            raise StaleElementReferenceException("element is no longer attached to the DOM")
+
+    def is_displayed(self):
+        self._check()
+        return self.visible
+
+    def is_enabled(self):
+        self._check()
+        return self.enabled
+
+    def click(self):
+        self._check()
+        self.clicks += 1
+
+    @property
+    def text(self):
+        self._check()
+        return self._text
+
+
+def _stub_page(*elements: StubElement, cache_elements: bool = True) -> BasePage:
+    """
+    Create a page whose driver returns the given elements from successive lookups.
+
+    Args:
+        elements: Elements returned by driver.find_element, in order
+        cache_elements: Value of the selenium.cache_elements setting
+    """
+    driver = mock.Mock()
+    driver.find_element.side_effect = list(elements)
+    page = BasePage(driver)
+    page.wait._timeout = 0.2
+    page._cfg = {**page._cfg, 'cache_elements': cache_elements}
+    return page
+
+
+LOCATOR = (By.CSS_SELECTOR, "#target")
+
+
+@pytest.mark.unit
+class TestPageConfig:
+    """Unit tests for the config values BasePage resolves from config.yaml."""
+
+    @pytest.fixture
+    def reload_config(self, tmp_path):
+        """
+        Load a temporary config.yaml, then reload the project config afterwards.
+
+        Returns:
+            Function taking the YAML text to load
+        """
+        def load(text: str):
+            config_path = tmp_path / "config.yaml"
+            config_path.write_text(text, encoding="utf-8")
+            config_manager.load_config(str(config_path))
+
+        yield load
+        config_manager.load_config()
+
+    def test_settings_follow_a_config_reload(self, reload_config):
+        """Pages created after load_config() use the newly loaded values."""
+        reload_config("selenium:\n  page_load_timeout: 5\n  html_snapshots_dir: snaps_a\n")
+        first = BasePage(mock.Mock())
+        assert first.wait._timeout == 5
+        assert first._get_snapshot_directory() == PROJECT_ROOT / "snaps_a"
+
+        reload_config("selenium:\n  page_load_timeout: 7\n  html_snapshots_dir: snaps_b\n"
+                      "  screenshots_dir: shots_b\n")
+        second = BasePage(mock.Mock())
+        assert second.wait._timeout == 7
+        assert second._get_snapshot_directory() == PROJECT_ROOT / "snaps_b"
+        assert second._get_screenshot_directory() == PROJECT_ROOT / "shots_b"
+
+    def test_settings_are_resolved_once_per_config(self):
+        """Pages share one resolved settings dict while the config is unchanged."""
+        assert BasePage(mock.Mock())._cfg is BasePage(mock.Mock())._cfg
+
+
+@pytest.mark.unit
+class TestElementCache:
+    """Unit tests for the selenium.cache_elements element cache."""
+
+    def test_repeat_interactions_reuse_the_element(self):
+        """A second interaction with the same locator doesn't look the element up again."""
+        page = _stub_page(StubElement("hello"))
+
+        assert page.get_text(LOCATOR) == "hello"
+        assert page.get_text(LOCATOR) == "hello"
+        assert page.driver.find_element.call_count == 1
+
+    def test_stale_cached_element_is_looked_up_again(self):
+        """A cached element that went stale is dropped and located again."""
+        old, new = StubElement("old"), StubElement("new")
+        page = _stub_page(old, new)
+        page.get_text(LOCATOR)
+
+        old.stale = True
+
+        assert page.get_text(LOCATOR) == "new"
+        assert page.get_text(LOCATOR) == "new"
+        assert page.driver.find_element.call_count == 2
+
+    def test_stale_during_action_is_retried(self):
+        """Staleness raised by the action itself also triggers one fresh lookup."""
+        old, new = StubElement(), StubElement()
+        page = _stub_page(old, new)
+        page.click(LOCATOR)
+
+        # Still passes the visibility check, but the click hits a detached node
+        old.click = mock.Mock(side_effect=StaleElementReferenceException("detached"))
+        page.click(LOCATOR)
+
+        assert new.clicks == 1
+
+    def test_open_and_refresh_clear_the_cache(self):
+        """Navigating with open() or refresh_page() forgets cached elements."""
+        page = _stub_page(StubElement(), StubElement(), StubElement())
+        page.get_text(LOCATOR)
+        page.open("about:blank")
+        page.get_text(LOCATOR)
+        page.refresh_page()
+        page.get_text(LOCATOR)
+
+        assert page.driver.find_element.call_count == 3
+
+    def test_repeat_clicks_reuse_the_element(self):
+        """Clicking the same element again, e.g. a header icon, needs no new lookup or check."""
+        icon = StubElement()
+        page = _stub_page(icon)
+
+        page.click(LOCATOR)
+        icon.is_displayed = mock.Mock(side_effect=AssertionError("condition checked again"))
+        page.click(LOCATOR)
+
+        assert icon.clicks == 2
+        assert page.driver.find_element.call_count == 1
+
+    def test_element_cached_for_visibility_is_checked_before_a_click(self):
+        """An element only known to be visible is waited on for clickability before it is clicked."""
+        visible, clickable = StubElement(), StubElement()
+        visible.enabled = False
+        page = _stub_page(visible, clickable)
+        page.get_text(LOCATOR)
+
+        page.click(LOCATOR)
+
+        assert visible.clicks == 0
+        assert clickable.clicks == 1
+
+    def test_element_that_became_hidden_is_located_again(self):
+        """A cached element that can no longer be interacted with is dropped and waited for again."""
+        old, new = StubElement(), StubElement()
+        page = _stub_page(old, new)
+        page.click(LOCATOR)
+
+        old.click = mock.Mock(side_effect=ElementNotInteractableException("hidden"))
+        page.click(LOCATOR)
+
+        assert new.clicks == 1
+
+
+@pytest.mark.unit
+class TestBatchLookup:
+    """Unit tests for the single-script batched element lookups."""
+
+    def test_find_elements_batch_uses_one_script_call(self):
+        """All locators are sent in one execute_script call and the results returned in order."""
+        logo = StubElement()
+        page = _stub_page()
+        page.driver.execute_script.return_value = [logo, None]
+
+        found = page.find_elements_batch([LOCATOR, (By.XPATH, "//h1")])
+
+        assert found == [logo, None]
+        page.driver.execute_script.assert_called_once_with(
+            mock.ANY, [[By.CSS_SELECTOR, "#target"], [By.XPATH, "//h1"]]
+        )
+        page.driver.find_element.assert_not_called()
+
+    def test_unsupported_strategy_is_rejected(self):
+        """Locator strategies the batch script can't evaluate raise ValueError before any request."""
+        page = _stub_page()
+
+        with pytest.raises(ValueError, match="find_elements_batch only supports CSS selector and XPath"):
+            page.find_elements_batch([LOCATOR, (By.ID, "target")])
+        page.driver.execute_script.assert_not_called()
+
+    def test_are_elements_present_polls_until_all_match(self):
+        """The presence script is repeated while any locator is still missing."""
+        page = _stub_page()
+        page.driver.execute_script.side_effect = [[True, False], [True, True]]
+
+        assert page.are_elements_present([LOCATOR, (By.XPATH, "//h1")], timeout=1) == [True, True]
+        assert page.driver.execute_script.call_count == 2
+
+    def test_are_elements_present_reports_missing_after_timeout(self):
+        """On timeout the last result is returned instead of raising."""
+        page = _stub_page()
+        page.driver.execute_script.return_value = [True, False]
+
+        assert page.are_elements_present([LOCATOR, (By.XPATH, "//h1")], timeout=0.2) == [True, False]
+
+    def test_are_elements_present_rejects_unsupported_strategy(self):
+        """are_elements_present() validates locators the same way as find_elements_batch()."""
+        with pytest.raises(ValueError, match="are_elements_present only supports"):
+            _stub_page().are_elements_present([(By.NAME, "q")])
@@ -0,0 +1,178 @@
+"""
+BasePage HTML Snapshot Unit Tests.
+
+These tests exercise the background snapshot writer with a mocked driver and a
+temporary snapshot directory; they don't start a browser or need network access.
+"""
+import gzip
+import threading
+import time
+from itertools import count
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from framework import base_page
+from framework.base_page import BasePage, HISTORY_SUFFIX, flush_snapshots, save_screenshot_file
+
+
+class SnapshotTestPage(BasePage):
+    """Page object used only by these tests."""
+
+    __slots__ = ()
+
+
+def _decompress(data: bytes) -> bytes:
+    """Decompress a history file with the codec base_page wrote it with."""
+    if HISTORY_SUFFIX == ".html.gz":
+        return gzip.decompress(data)
+    return base_page.zstandard.ZstdDecompressor().decompress(data)
+
+
+@pytest.mark.unit
+class TestHTMLSnapshotWriter:
+    """Unit tests for save_html_snapshot() and the snapshot writer thread."""
+
+    @pytest.fixture
+    def snapshot_dir(self, tmp_path, monkeypatch):
+        """
+        Point snapshots at a temporary directory and reset the dedup hashes.
+
+        Each capture gets a distinct history timestamp, so tests don't depend
+        on the wall clock.
+
+        Returns:
+            Path of the temporary snapshot directory
+        """
+        ticks = count(1)
+        monkeypatch.setattr(base_page, "time", SimpleNamespace(
+            strftime=lambda fmt: f"20260101_{next(ticks):06d}",
+        ))
+        monkeypatch.setattr(BasePage, "_get_snapshot_directory", lambda self: tmp_path)
+        monkeypatch.setattr(BasePage, "_last_snapshot_hash", {})
+        yield tmp_path
+        flush_snapshots()
+
+    @staticmethod
+    def _page(html: str) -> SnapshotTestPage:
+        """Create the test page on a mocked driver serving the given HTML."""
+        return SnapshotTestPage(mock.Mock(page_source=html))
+
+    @staticmethod
+    def _history(snapshot_dir):
+        """History files of the test page, oldest first."""
+        return sorted((snapshot_dir / "history").glob(f"SnapshotTestPage_*{HISTORY_SUFFIX}"))
+
+    def test_identical_html_is_written_once(self, snapshot_dir):
+        """A second capture of unchanged HTML writes no new files."""
+        page = self._page("<html>same</html>")
+
+        page.save_html_snapshot()
+        page.save_html_snapshot()
+        flush_snapshots()
+
+        assert (snapshot_dir / "SnapshotTestPage.html").read_text() == "<html>same</html>"
+        assert len(self._history(snapshot_dir)) == 1
+
+    def test_changed_html_is_written_again(self, snapshot_dir):
+        """A capture with different HTML replaces the current snapshot."""
+        page = self._page("<html>first</html>")
+        page.save_html_snapshot()
+
+        page.driver.page_source = "<html>second</html>"
+        page.save_html_snapshot()
+        flush_snapshots()
+
+        assert (snapshot_dir / "SnapshotTestPage.html").read_text() == "<html>second</html>"
+        assert len(self._history(snapshot_dir)) == 2
+
+    def test_failed_write_is_retried_on_next_capture(self, snapshot_dir, monkeypatch):
+        """The content hash is dropped when writing fails, so the same HTML is written again."""
+        blocked_dir = snapshot_dir / "blocked"
+        blocked_dir.write_text("not a directory")
+        monkeypatch.setattr(BasePage, "_get_snapshot_directory", lambda self: blocked_dir)
+        page = self._page("<html>retry</html>")
+
+        page.save_html_snapshot()
+        flush_snapshots()
+        assert "SnapshotTestPage" not in BasePage._last_snapshot_hash
+
+        monkeypatch.setattr(BasePage, "_get_snapshot_directory", lambda self: snapshot_dir)
+        page.save_html_snapshot()
+        flush_snapshots()
+
+        assert (snapshot_dir / "SnapshotTestPage.html").read_text() == "<html>retry</html>"
+
+    def test_history_is_compressed(self, snapshot_dir):
+        """The history copy decompresses to the captured HTML; the current snapshot is left as plain HTML."""
+        html = "<html>" + "<p>compressible</p>" * 200 + "</html>"
+        self._page(html).save_html_snapshot()
+        flush_snapshots()
+
+        (history_file,) = self._history(snapshot_dir)
+        assert _decompress(history_file.read_bytes()) == html.encode()
+        assert history_file.stat().st_size < len(html)
+        assert (snapshot_dir / "SnapshotTestPage.html").read_text() == html
+
+    def test_history_is_rotated_to_keep_history(self, snapshot_dir):
+        """Only the newest keep_history versions stay in the history directory."""
+        page = self._page("")
+        for version in range(5):
+            page.driver.page_source = f"<html>{version}</html>"
+            page.save_html_snapshot(keep_history=2)
+        flush_snapshots()
+
+        assert [path.name for path in self._history(snapshot_dir)] == [
+            f"SnapshotTestPage_20260101_00000{tick}{HISTORY_SUFFIX}" for tick in (4, 5)
+        ]
+
+    def test_rotation_includes_files_from_other_processes(self, snapshot_dir):
+        """Files another process added to the history directory count towards keep_history."""
+        page = self._page("<html>0</html>")
+        page.save_html_snapshot(keep_history=2)
+        flush_snapshots()
+
+        # Written by another (xdist) worker
+        (snapshot_dir / "history" / f"SnapshotTestPage_20260101_000000{HISTORY_SUFFIX}").write_bytes(b"")
+
+        for version in range(1, 3):
+            page.driver.page_source = f"<html>{version}</html>"
+            page.save_html_snapshot(keep_history=2)
+        flush_snapshots()
+
+        assert len(self._history(snapshot_dir)) == 2
+
+    def test_flush_snapshots_waits_for_queued_writes(self, tmp_path, monkeypatch):
+        """flush_snapshots() returns only after every queued write has finished."""
+        written = []
+        lock = threading.Lock()
+
+        def slow_write(filepath, png):
+            time.sleep(0.05)
+            with lock:
+                written.append(filepath)
+
+        monkeypatch.setattr(BasePage, "_write_screenshot_file", staticmethod(slow_write))
+        paths = [tmp_path / f"shot_{index}.png" for index in range(5)]
+        for path in paths:
+            save_screenshot_file(path, b"PNG")
+
+        flush_snapshots()
+
+        assert written == paths
+
+    def test_failed_job_does_not_stop_the_writer(self, tmp_path, monkeypatch):
+        """A write that raises is logged, and later writes and flush_snapshots() still complete."""
+        def failing_write(filepath, png):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(BasePage, "_write_screenshot_file", staticmethod(failing_write))
+        save_screenshot_file(tmp_path / "lost.png", b"PNG")
+        flush_snapshots()
+        monkeypatch.undo()
+
+        save_screenshot_file(tmp_path / "saved.png", b"PNG")
+        flush_snapshots()
+
+        assert base_page._snapshot_worker.is_alive()
+        assert (tmp_path / "saved.png").read_bytes() == b"PNG"
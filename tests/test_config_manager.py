@@ -0,0 +1,105 @@
+"""
+Configuration Manager Unit Tests.
+
+These tests cover loading config.yaml through its JSON sidecar cache and the
+dotted-key lookups, using temporary config files; they don't start a browser or
+need network access.
+"""
+import json
+import os
+
+import pytest
+from framework import config_manager
+
+
+@pytest.fixture(autouse=True)
+def _restore_config():
+    """Reload the project config after each test."""
+    yield
+    config_manager.load_config()
+
+
+@pytest.mark.unit
+class TestConfigCache:
+    """Unit tests for the .config.cache.json sidecar written by load_config()."""
+
+    @staticmethod
+    def _write_yaml(path, timeout: int, mtime_ns: int):
+        """Write a minimal config file with the given modification time."""
+        path.write_text(f"selenium:\n  timeout: {timeout}\n", encoding="utf-8")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_cache_is_written_next_to_config(self, tmp_path):
+        """Loading the YAML file writes a cache with the same contents."""
+        config_path = tmp_path / "config.yaml"
+        self._write_yaml(config_path, 10, 1_000_000_000)
+
+        config_manager.load_config(str(config_path))
+
+        cache_path = tmp_path / ".config.cache.json"
+        assert json.loads(cache_path.read_text()) == {"selenium": {"timeout": 10}}
+        assert config_manager.get("selenium.timeout") == 10
+
+    def test_fresh_cache_is_used(self, tmp_path):
+        """A cache at least as new as the YAML file is loaded instead of the YAML."""
+        config_path = tmp_path / "config.yaml"
+        self._write_yaml(config_path, 10, 1_000_000_000)
+        cache_path = tmp_path / ".config.cache.json"
+        cache_path.write_text(json.dumps({"selenium": {"timeout": 99}}), encoding="utf-8")
+        os.utime(cache_path, ns=(2_000_000_000, 2_000_000_000))
+
+        config_manager.load_config(str(config_path))
+
+        assert config_manager.get("selenium.timeout") == 99
+
+    def test_cache_is_invalidated_when_config_changes(self, tmp_path):
+        """Editing config.yaml after the cache was written makes load_config() reread it."""
+        config_path = tmp_path / "config.yaml"
+        self._write_yaml(config_path, 10, 1_000_000_000)
+        config_manager.load_config(str(config_path))
+        cache_path = tmp_path / ".config.cache.json"
+        os.utime(cache_path, ns=(2_000_000_000, 2_000_000_000))
+
+        self._write_yaml(config_path, 20, 3_000_000_000)
+        config_manager.load_config(str(config_path))
+
+        assert config_manager.get("selenium.timeout") == 20
+        assert json.loads(cache_path.read_text()) == {"selenium": {"timeout": 20}}
+
+
+@pytest.mark.unit
+class TestDottedKeyLookup:
+    """Unit tests for get() on the flattened config."""
+
+    @pytest.fixture
+    def loaded(self, tmp_path):
+        """Load a small nested config from a temporary file."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            "browser:\n  name: chrome\n  headless: false\n"
+            "test_data:\n  login:\n    username: user@user.com\n",
+            encoding="utf-8",
+        )
+        config_manager.load_config(str(config_path))
+
+    def test_leaf_values(self, loaded):
+        """Leaves are looked up by their full dotted path."""
+        assert config_manager.get("browser.name") == "chrome"
+        assert config_manager.get("browser.headless") is False
+        assert config_manager.get("test_data.login.username") == "user@user.com"
+
+    def test_sections(self, loaded):
+        """Nested sections can be looked up as dicts too."""
+        assert config_manager.get("browser") == {"name": "chrome", "headless": False}
+        assert config_manager.get("test_data.login") == {"username": "user@user.com"}
+
+    def test_missing_keys_return_default(self, loaded):
+        """Missing keys, including paths through a leaf, return the default."""
+        assert config_manager.get("browser.window_size") is None
+        assert config_manager.get("browser.window_size", "1920x1080") == "1920x1080"
+        assert config_manager.get("browser.name.first", "x") == "x"
+
+    def test_config_manager_delegates(self, loaded):
+        """ConfigManager.get() reads the same flattened lookup."""
+        assert config_manager.config.get("browser.name") == "chrome"
+        assert config_manager.config.get_browser_config() == {"name": "chrome", "headless": False}
@@ -0,0 +1,233 @@
+"""
+Conftest Hook Unit Tests.
+
+These tests call the collection and session hooks of conftest.py with stub
+test items and a temporary history file; they don't start a browser or need
+network access.
+"""
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from tests import conftest
+
+
+class StubItem:
+    """Collected test item stand-in, built from a node ID."""
+
+    def __init__(self, nodeid: str, fixturenames=(), markers=()):
+        self.nodeid = nodeid
+        parts = nodeid.split("::")
+        self._parents = {pytest.Module: SimpleNamespace(nodeid=parts[0])}
+        if len(parts) > 2:
+            self._parents[pytest.Class] = SimpleNamespace(nodeid="::".join(parts[:2]))
+        self.fixturenames = list(fixturenames)
+        self.own_markers = [getattr(pytest.mark, name) for name in markers]
+
+    def getparent(self, node_type):
+        return self._parents.get(node_type)
+
+    def get_closest_marker(self, name):
+        return next((mark.mark for mark in self.own_markers if mark.name == name), None)
+
+    def add_marker(self, marker):
+        self.own_markers.append(marker)
+
+
+def _stub_config(plugins=(), reruns=None, args=(), rootpath: Path = None):
+    """Create a pytest config stand-in with the given plugins, --reruns value and arguments."""
+    return SimpleNamespace(
+        pluginmanager=SimpleNamespace(hasplugin=lambda name: name in plugins),
+        getoption=lambda name, default=None: reruns if name == "reruns" else default,
+        getini=lambda name: "",
+        args=list(args),
+        rootpath=rootpath,
+        invocation_params=SimpleNamespace(dir=rootpath),
+    )
+
+
+@pytest.fixture
+def history_file(tmp_path, monkeypatch):
+    """
+    Point the test history at a temporary file and reset this run's state.
+
+    Returns:
+        Function writing a history dict to the file
+    """
+    path = tmp_path / ".pytest_history.json"
+    monkeypatch.setattr(conftest, "HISTORY_FILE", path)
+    monkeypatch.setattr(conftest, "_collected_ids", set())
+    monkeypatch.setattr(conftest, "_run_results", {})
+    monkeypatch.setattr(conftest, "flush_snapshots", lambda: None)
+
+    def write(history: dict):
+        path.write_text(json.dumps(history), encoding="utf-8")
+    return write
+
+
+def _order(items, config=None):
+    """Run the collection hook and return the resulting node IDs."""
+    conftest.pytest_collection_modifyitems(config or _stub_config(), items)
+    return [item.nodeid for item in items]
+
+
+@pytest.mark.unit
+class TestBrowserFreeFirst:
+    """Unit tests for running tests that don't need a browser first."""
+
+    def test_browser_free_modules_run_first(self, history_file):
+        """A module without browser tests runs before one that uses the driver fixture."""
+        assert _order([
+            StubItem("ui.py::test_page", fixturenames=["driver"]),
+            StubItem("unit.py::test_one"),
+        ]) == ["unit.py::test_one", "ui.py::test_page"]
+
+    def test_browser_free_classes_run_first_within_a_module(self, history_file):
+        """Within a module, classes are reordered but each class stays together."""
+        assert _order([
+            StubItem("t.py::TestUI::test_one", markers=["ui"]),
+            StubItem("t.py::TestUI::test_two"),
+            StubItem("t.py::TestUnit::test_one"),
+        ]) == ["t.py::TestUnit::test_one", "t.py::TestUI::test_one", "t.py::TestUI::test_two"]
+
+    def test_browser_need_outranks_previous_failures(self, history_file):
+        """A browser module that failed last time still runs after browser-free modules."""
+        history_file({"ui.py::test_page": {"failed": True, "duration": 1.0}})
+
+        assert _order([
+            StubItem("ui.py::test_page", fixturenames=["driver_session"]),
+            StubItem("unit.py::test_one"),
+        ]) == ["unit.py::test_one", "ui.py::test_page"]
+
+
+@pytest.mark.unit
+class TestHistoryOrdering:
+    """Unit tests for ordering tests by their previous results."""
+
+    def test_groups_that_failed_last_time_run_first(self, history_file):
+        """A class with a previously failed test moves ahead of passing classes."""
+        history_file({"t.py::TestB::test_one": {"failed": True, "duration": 9.0}})
+
+        assert _order([
+            StubItem("t.py::TestA::test_one"),
+            StubItem("t.py::TestB::test_one"),
+        ]) == ["t.py::TestB::test_one", "t.py::TestA::test_one"]
+
+    def test_shorter_groups_run_first_and_keep_their_order(self, history_file):
+        """Classes are ordered by total duration; tests inside a class are not reordered."""
+        history_file({
+            "t.py::TestSlow::test_one": {"duration": 5.0},
+            "t.py::TestFast::test_one": {"duration": 2.0},
+            "t.py::TestFast::test_two": {"duration": 0.5},
+        })
+
+        assert _order([
+            StubItem("t.py::TestSlow::test_one"),
+            StubItem("t.py::TestFast::test_one"),
+            StubItem("t.py::TestFast::test_two"),
+        ]) == ["t.py::TestFast::test_one", "t.py::TestFast::test_two", "t.py::TestSlow::test_one"]
+
+    def test_functions_outside_a_class_use_their_own_results(self, history_file):
+        """Module-level test functions are ordered by their own failures and durations."""
+        history_file({
+            "t.py::test_slow": {"duration": 5.0},
+            "t.py::test_failed": {"failed": True, "duration": 8.0},
+            "t.py::test_fast": {"duration": 1.0},
+        })
+
+        assert _order([
+            StubItem("t.py::test_slow"),
+            StubItem("t.py::test_fast"),
+            StubItem("t.py::test_failed"),
+        ]) == ["t.py::test_failed", "t.py::test_fast", "t.py::test_slow"]
+
+
+@pytest.mark.unit
+class TestFlakyMarker:
+    """Unit tests for opting browser tests into a single rerun."""
+
+    def test_browser_tests_are_rerun_once_on_webdriver_errors(self, history_file):
+        """Browser tests get a flaky marker that reruns WebDriverException but not timeouts."""
+        browser, unit = StubItem("t.py::test_ui", fixturenames=["driver"]), StubItem("t.py::test_unit")
+
+        _order([browser, unit], _stub_config(plugins=("rerunfailures",)))
+
+        flaky = browser.get_closest_marker("flaky")
+        assert flaky.kwargs == {
+            "reruns": 1,
+            "only_rerun": [conftest.WebDriverException],
+            "rerun_except": [conftest.TimeoutException],
+        }
+        assert unit.get_closest_marker("flaky") is None
+
+    def test_configured_reruns_are_left_alone(self, history_file):
+        """No marker is added when --reruns is given."""
+        browser = StubItem("t.py::test_ui", markers=["ui"])
+
+        _order([browser], _stub_config(plugins=("rerunfailures",), reruns=3))
+
+        assert browser.get_closest_marker("flaky") is None
+
+    def test_own_flaky_marker_is_kept(self, history_file):
+        """A test's own flaky marker isn't replaced."""
+        browser = StubItem("t.py::test_ui", markers=["ui", "flaky"])
+
+        _order([browser], _stub_config(plugins=("rerunfailures",)))
+
+        assert [mark.name for mark in browser.own_markers] == ["ui", "flaky"]
+
+
+@pytest.mark.unit
+class TestHistoryFile:
+    """Unit tests for saving the test history at the end of the session."""
+
+    @pytest.fixture
+    def finish(self, monkeypatch):
+        """
+        Run the session finish hook with the given results as this run's.
+
+        Returns:
+            Function taking (config, results) and returning the saved history
+        """
+        def run(config, results: dict) -> dict:
+            monkeypatch.setattr(conftest, "_run_results", dict(results))
+            conftest.pytest_sessionfinish(SimpleNamespace(config=config), 0)
+            return json.loads(conftest.HISTORY_FILE.read_text(encoding="utf-8"))
+        return run
+
+    def test_removed_tests_are_dropped(self, history_file, finish, tmp_path):
+        """Entries of deleted files and of tests no longer in a collected module are dropped."""
+        (tmp_path / "t.py").write_text("")
+        history_file({
+            "t.py::test_kept": {"duration": 1.0},
+            "t.py::test_renamed": {"duration": 1.0},
+            "gone.py::test_one": {"duration": 1.0},
+        })
+        _order([StubItem("t.py::test_kept"), StubItem("t.py::test_new")])
+
+        history = finish(_stub_config(rootpath=tmp_path), {"t.py::test_new": {"duration": 2.0}})
+
+        assert sorted(history) == ["t.py::test_kept", "t.py::test_new"]
+
+    def test_tests_outside_this_run_are_kept(self, history_file, finish, tmp_path):
+        """Entries of deselected tests, other modules, and modules narrowed by node ID stay."""
+        for name in ("t.py", "other.py", "narrowed.py"):
+            (tmp_path / name).write_text("")
+        history_file({
+            "t.py::test_deselected": {"duration": 1.0},
+            "other.py::test_one": {"duration": 1.0},
+            "narrowed.py::test_two": {"duration": 1.0},
+        })
+        conftest.pytest_deselected([StubItem("t.py::test_deselected")])
+        _order([StubItem("t.py::test_run"), StubItem("narrowed.py::test_one")])
+
+        history = finish(
+            _stub_config(rootpath=tmp_path, args=["t.py", "narrowed.py::test_one"]),
+            {"t.py::test_run": {"duration": 1.0}, "narrowed.py::test_one": {"duration": 1.0}},
+        )
+
+        assert sorted(history) == [
+            "narrowed.py::test_one", "narrowed.py::test_two", "other.py::test_one",
+            "t.py::test_deselected", "t.py::test_run",
+        ]
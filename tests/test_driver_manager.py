@@ -0,0 +1,101 @@
+"""
+DriverManager Pool Unit Tests.
+
+These tests exercise the driver pool with stub drivers; they don't start a
+browser or need network access.
+"""
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from framework.config_manager import config
+from framework.driver_manager import DriverManager
+
+# Driver commands used by the pool; Chrome drivers also have execute_cdp_cmd
+_DRIVER_METHODS = ['title', 'get', 'quit', 'execute_script', 'delete_all_cookies']
+
+
+def _stub_driver(chrome: bool = True) -> mock.Mock:
+    """Create a stub WebDriver with only the commands of a Chrome or Firefox driver."""
+    return mock.Mock(spec=_DRIVER_METHODS + (['execute_cdp_cmd'] if chrome else []))
+
+
+@pytest.mark.unit
+class TestDriverPool:
+    """Unit tests for get_driver(), release_driver() and reset_driver()."""
+
+    @pytest.fixture(autouse=True)
+    def created(self, monkeypatch):
+        """
+        Give each test an empty pool and make new drivers stubs.
+
+        Returns:
+            List of the stub drivers created, in order
+        """
+        created = []
+
+        def create(browser_config, headless, block_images):
+            created.append(_stub_driver())
+            return created[-1]
+
+        monkeypatch.setattr(DriverManager, "_pool", {})
+        monkeypatch.setattr(DriverManager, "_pool_keys", {})
+        monkeypatch.setattr(DriverManager, "_create_chrome_driver", staticmethod(create))
+        monkeypatch.setattr(config, "get_browser_config", lambda: {'name': 'chrome', 'headless': True})
+        return created
+
+    def test_released_driver_is_reused(self, created):
+        """A released driver is reset and handed out by the next get_driver() call."""
+        driver = DriverManager.get_driver()
+        DriverManager.release_driver(driver)
+
+        assert DriverManager.get_driver() is driver
+        assert len(created) == 1
+        driver.get.assert_called_once_with('about:blank')
+
+    def test_pool_is_keyed_by_options(self, created):
+        """A driver released with other options isn't reused."""
+        DriverManager.release_driver(DriverManager.get_driver(block_images=True))
+
+        assert DriverManager.get_driver() is created[1]
+
+    def test_unresponsive_pooled_driver_is_replaced(self, created):
+        """A pooled driver whose browser died is quit and a new one created."""
+        dead = DriverManager.get_driver()
+        DriverManager.release_driver(dead)
+        type(dead).title = mock.PropertyMock(side_effect=WebDriverException("browser closed"))
+
+        driver = DriverManager.get_driver()
+
+        assert driver is created[1]
+        dead.quit.assert_called_once_with()
+
+    def test_driver_that_fails_to_reset_is_quit(self, created):
+        """A driver that can't be reset is quit instead of pooled."""
+        driver = DriverManager.get_driver()
+        driver.get.side_effect = WebDriverException("tab crashed")
+
+        DriverManager.release_driver(driver)
+
+        driver.quit.assert_called_once_with()
+        assert DriverManager.get_driver() is created[1]
+
+    def test_chrome_reset_clears_cookies_of_every_site(self):
+        """Chrome cookies are cleared for all sites through the DevTools protocol."""
+        driver = _stub_driver(chrome=True)
+
+        DriverManager.reset_driver(driver)
+
+        driver.execute_cdp_cmd.assert_called_once_with('Network.clearBrowserCookies', {})
+        driver.delete_all_cookies.assert_not_called()
+        driver.execute_script.assert_called_once()
+        driver.get.assert_called_once_with('about:blank')
+
+    def test_reset_without_devtools_deletes_current_site_cookies(self):
+        """Browsers without DevTools commands delete the current site's cookies before leaving it."""
+        driver = _stub_driver(chrome=False)
+        driver.execute_script.side_effect = WebDriverException("no web storage")
+
+        DriverManager.reset_driver(driver)
+
+        assert [call[0] for call in driver.method_calls] == ['delete_all_cookies', 'execute_script', 'get']
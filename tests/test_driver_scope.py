@@ -0,0 +1,72 @@
+"""
+Driver Scope Tests.
+
+These tests run small test files with the driver fixture from conftest.py in
+an isolated pytest session, with DriverManager stubbed out; they don't start a
+browser or need network access.
+"""
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from framework.driver_manager import DriverManager
+
+pytest_plugins = ("pytester",)
+
+CONFTEST = Path(__file__).with_name("conftest.py")
+
+# Two tests using the driver fixture
+TESTS = """
+def test_first(driver):
+    pass
+
+def test_second(driver):
+    pass
+"""
+
+
+@pytest.mark.unit
+class TestDriverScope:
+    """Unit tests for the --driver-scope option of the driver fixture."""
+
+    @pytest.fixture
+    def manager(self, pytester, monkeypatch):
+        """
+        Write the conftest and test file, and replace DriverManager's browser calls with stubs.
+
+        Returns:
+            Mock recording the DriverManager calls
+        """
+        pytester.makeconftest(CONFTEST.read_text(encoding="utf-8"))
+        pytester.makepyfile(test_scope=TESTS)
+        calls = mock.Mock()
+        calls.get_driver.side_effect = lambda **options: mock.Mock()
+        for name in ("get_driver", "release_driver", "reset_driver", "quit_driver", "close_pool"):
+            monkeypatch.setattr(DriverManager, name, getattr(calls, name))
+        return calls
+
+    def test_function_scope_gets_a_driver_per_test(self, pytester, manager):
+        """By default every test checks a driver out of the pool and releases it."""
+        pytester.runpytest("-p", "no:cacheprovider").assert_outcomes(passed=2)
+
+        assert manager.get_driver.call_count == 2
+        released = [call.args[0] for call in manager.release_driver.call_args_list]
+        assert len(set(map(id, released))) == 2
+        manager.reset_driver.assert_not_called()
+
+    @pytest.mark.parametrize("scope", ["module", "session"])
+    def test_shared_scope_resets_the_driver_between_tests(self, pytester, manager, scope):
+        """With a shared scope both tests use one driver, reset after each test."""
+        result = pytester.runpytest("-p", "no:cacheprovider", f"--driver-scope={scope}")
+
+        result.assert_outcomes(passed=2)
+        assert manager.get_driver.call_count == 1
+        (driver,) = manager.release_driver.call_args.args
+        assert manager.reset_driver.call_args_list == [mock.call(driver)] * 2
+
+    def test_unknown_scope_is_rejected(self, pytester, manager):
+        """Only function, module and session are accepted."""
+        result = pytester.runpytest("-p", "no:cacheprovider", "--driver-scope=class")
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        manager.get_driver.assert_not_called()
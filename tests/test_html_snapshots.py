@@ -10,12 +10,16 @@ Run these tests when:
 - The UI has changed and you need updated HTML
 - Building new page objects with Claude Code assistance
 """
+import logging
 import pytest
 from pages.grocerymate_home_page import GroceryMateHomePage
 from pages.grocerymate_login_page import GroceryMateLoginPage
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.html_capture
+@pytest.mark.lightweight
 class TestHTMLSnapshots:
     """
     Test suite for capturing HTML snapshots.
@@ -24,37 +28,49 @@ class TestHTMLSnapshots:
     to trigger HTML snapshot capture for Claude Code analysis.
     """
 
-    def test_capture_home_page_html(self, driver):
+    @pytest.fixture(autouse=True)
+    def _reset_browser(self, driver_session):
+        """
+        Clear cookies before each test.
+
+        The tests in this class only read pages, so they share the
+        session-scoped driver instead of starting a browser each.
+        """
+        driver_session.delete_all_cookies()
+        yield
+
+    def test_capture_home_page_html(self, driver_session):
         """
         Capture HTML snapshot of the GroceryMate home page.
 
         After running this test:
         - HTML saved to: page_snapshots/GroceryMateHomePage.html
-        - Historical versions: page_snapshots/history/GroceryMateHomePage_*.html (keeps 2)
+        - Historical versions: page_snapshots/history/GroceryMateHomePage_* (compressed, keeps 2)
         - Ask Claude Code to analyze the HTML and update page object
         """
-        home_page = GroceryMateHomePage(driver)
+        home_page = GroceryMateHomePage(driver_session)
         home_page.open_home_page()
 
         # Manually save HTML snapshot with 2-version history
         home_page.save_html_snapshot(keep_history=2)
 
         # Basic verification that page loaded
-        assert driver.current_url is not None
-        print(f"\n✓ Home page HTML captured: {driver.current_url}")
-        print("  Current snapshot: page_snapshots/GroceryMateHomePage.html")
-        print("  History (keeps 2): page_snapshots/history/")
+        current_url = driver_session.current_url
+        assert current_url is not None
+        logger.info("Home page HTML captured: %s", current_url)
+        logger.info("  Current snapshot: page_snapshots/GroceryMateHomePage.html")
+        logger.info("  History (keeps 2): page_snapshots/history/")
 
-    def test_capture_login_page_html(self, driver):
+    def test_capture_login_page_html(self, driver_session):
         """
         Capture HTML snapshot of the GroceryMate authentication page.
 
         After running this test:
         - HTML saved to: page_snapshots/GroceryMateLoginPage.html
-        - Historical versions: page_snapshots/history/GroceryMateLoginPage_*.html (keeps 2)
+        - Historical versions: page_snapshots/history/GroceryMateLoginPage_* (compressed, keeps 2)
         - Ask Claude Code to analyze and build login page object with form locators
         """
-        login_page = GroceryMateLoginPage(driver)
+        login_page = GroceryMateLoginPage(driver_session)
         login_page.navigate_to_login()
 
         # Manually save HTML snapshot with 2-version history
@@ -62,15 +78,15 @@ class TestHTMLSnapshots:
 
         # Basic verification that page loaded
         assert login_page.is_on_login_page()
-        print(f"\n✓ Login page HTML captured: {driver.current_url}")
-        print("  Current snapshot: page_snapshots/GroceryMateLoginPage.html")
-        print("  History (keeps 2): page_snapshots/history/")
+        logger.info("Login page HTML captured: %s", driver_session.current_url)
+        logger.info("  Current snapshot: page_snapshots/GroceryMateLoginPage.html")
+        logger.info("  History (keeps 2): page_snapshots/history/")
 
     # Add more HTML capture tests here as you explore new pages:
-    # def test_capture_shop_page_html(self, driver):
+    # def test_capture_shop_page_html(self, driver_session):
     #     """Capture HTML snapshot of the shop page."""
     #     pass
 
-    # def test_capture_product_details_page_html(self, driver):
+    # def test_capture_product_details_page_html(self, driver_session):
     #     """Capture HTML snapshot of a product details page."""
     #     pass
@@ -0,0 +1,175 @@
+"""
+Logger Unit Tests.
+
+These tests exercise the queued logging setup with temporary log files; they
+don't start a browser or need network access.
+"""
+import logging
+from unittest import mock
+
+import pytest
+from framework import logger as framework_logging
+from framework.logger import log_assertion, log_test_step, setup_logger
+
+
+@pytest.mark.unit
+class TestQueuedLogging:
+    """Unit tests for the shared log queue and its listener thread."""
+
+    @pytest.fixture
+    def make_logger(self, request, tmp_path):
+        """
+        Create file-only loggers with names unique to the test, removed afterwards.
+
+        Returns:
+            Function taking a short name and returning (logger, log file path)
+        """
+        names = []
+
+        def make(suffix: str):
+            name = f"{request.node.name}.{suffix}"
+            log_file = tmp_path / f"{suffix}.log"
+            names.append(name)
+            return setup_logger(name, log_file=str(log_file), console_output=False), log_file
+
+        yield make
+        for name in names:
+            framework_logging._stop_listener(name)
+
+    def test_records_reach_only_their_own_loggers_handlers(self, make_logger):
+        """Two loggers share the queue, but each file only gets its own records."""
+        first, first_file = make_logger("first")
+        second, second_file = make_logger("second")
+
+        first.info("from first")
+        second.info("from second")
+        framework_logging._stop_listener(first.name)
+        framework_logging._stop_listener(second.name)
+
+        assert "from first" in first_file.read_text()
+        assert "from second" not in first_file.read_text()
+        assert "from second" in second_file.read_text()
+
+    def test_loggers_share_one_listener(self, make_logger):
+        """Configuring another logger doesn't start another listener thread."""
+        make_logger("first")
+        listener = framework_logging._listener
+
+        make_logger("second")
+
+        assert framework_logging._listener is listener
+
+    def test_arguments_are_merged_when_logging(self, make_logger):
+        """Changing an argument after the call doesn't change the logged message."""
+        log, log_file = make_logger("args")
+        items = ["before"]
+
+        log.info("items: %s", items)
+        items[0] = "after"
+        framework_logging._stop_listener(log.name)
+
+        assert "items: ['before']" in log_file.read_text()
+
+    def test_stop_all_listeners_writes_queued_records(self, make_logger):
+        """The exit hook drains the queue and closes every logger's handlers."""
+        log, log_file = make_logger("exit")
+        log.info("queued at exit")
+
+        try:
+            framework_logging._stop_all_listeners()
+
+            assert "queued at exit" in log_file.read_text()
+            assert framework_logging._listener is None
+            assert not framework_logging._routes
+        finally:
+            # Restore the framework logger the exit hook removed
+            setup_logger('framework', level=logging.INFO)
+
+
+@pytest.mark.unit
+class TestBufferedFileHandler:
+    """Unit tests for the batched log file writes."""
+
+    @staticmethod
+    def _record(level: int, message: str) -> logging.LogRecord:
+        """Create a log record at the given level."""
+        return logging.LogRecord("buffered", level, __file__, 0, message, None, None)
+
+    def test_records_are_written_in_batches(self, tmp_path):
+        """INFO records stay in memory until a WARNING arrives, then all are written in order."""
+        log_file = tmp_path / "buffered.log"
+        handler = framework_logging._BufferedFileHandler(logging.FileHandler(log_file, encoding='utf-8'))
+
+        try:
+            handler.handle(self._record(logging.INFO, "first"))
+            assert log_file.read_text() == ""
+
+            handler.handle(self._record(logging.WARNING, "second"))
+            assert log_file.read_text().splitlines() == ["first", "second"]
+        finally:
+            handler.close()
+
+    def test_close_writes_buffered_records(self, tmp_path):
+        """Closing the handler writes what is still buffered and closes the file."""
+        log_file = tmp_path / "buffered.log"
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        handler = framework_logging._BufferedFileHandler(file_handler)
+        handler.handle(self._record(logging.DEBUG, "buffered"))
+
+        handler.close()
+
+        assert log_file.read_text() == "buffered\n"
+        assert file_handler.stream is None
+
+
+@pytest.mark.unit
+class TestLogHelpers:
+    """Unit tests for log_test_step() and log_assertion()."""
+
+    @pytest.fixture
+    def captured(self, request):
+        """
+        Logger that keeps its records in a list instead of writing them.
+
+        Returns:
+            (logger, list of emitted records)
+        """
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        log = logging.getLogger(f"helpers.{request.node.name}")
+        log.propagate = False
+        log.addHandler(handler)
+        yield log, records
+        log.removeHandler(handler)
+
+    def test_step_is_one_record(self, captured):
+        """The step and its separator lines are emitted together."""
+        log, records = captured
+        log.setLevel(logging.INFO)
+
+        log_test_step(log, "Open the shop")
+
+        (record,) = records
+        assert record.getMessage().splitlines() == ["=" * 60, "STEP: Open the shop", "=" * 60]
+
+    def test_disabled_helpers_log_nothing(self, captured):
+        """Steps and passed assertions are skipped without formatting when INFO is disabled."""
+        log, records = captured
+        log.setLevel(logging.WARNING)
+        unprintable = mock.Mock(__str__=mock.Mock(side_effect=AssertionError("formatted")))
+
+        log_test_step(log, unprintable)
+        log_assertion(log, "Title", unprintable, unprintable, passed=True)
+
+        assert records == []
+
+    def test_failed_assertion_is_logged_at_error(self, captured):
+        """A failed assertion is still logged when only warnings and errors are enabled."""
+        log, records = captured
+        log.setLevel(logging.WARNING)
+
+        log_assertion(log, "Title", "Home", "Login", passed=False)
+
+        assert [record.levelno for record in records] == [logging.ERROR] * 3
+        assert records[0].getMessage() == "ASSERT [FAIL]: Title"